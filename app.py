@@ -6,25 +6,67 @@
 # - Validierung je Diagrammtyp +
 # - Plot ausführen (ruft plotter.*) +
 # - Statistik (nur als Text in "Details") anzeigen +
-# - PNG speichern (Menü + Button neben Plot) +-
+# - Export PNG/SVG/PDF im Hintergrund (Menü + Button neben Plot) +
 # ------------------------------------------------------
 
+import math
 import os
+import queue
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
 
 import pandas as pd
+import matplotlib.dates as mdates
 
 from ui_main import MainUI
-from data_loader import load_csv, infer_columns
+from data_loader import (
+    open_table,
+    load_csv,
+    load_parquet,
+    index_sorted_column,
+    read_overview,
+    read_rows,
+    x_range_to_rows,
+    read_parquet_overview,
+    read_parquet_range,
+    read_parquet_rows,
+    load_many,
+    combine_frames,
+    source_labels,
+    infer_columns,
+    is_parquet,
+    SOURCE_COL,
+    LAZY_PARQUET_ROWS,
+    PARQUET_ZOOM_ROWS,
+)
+from exporter import snapshot_figure, export_figure
+from jobs import Job
+from resampler import build_pyramid, choose_level, level_frame, RESAMPLE_AGGS, RESAMPLE_MIN_ROWS
 from plotter import (
     plot_line,
     plot_stacked_area,
     plot_pie,
     plot_hist,
     plot_polar,
+    aggregate_pie,
+    aggregate_polar,
 )
 
+# Menüeintrag Export (wird wie der Button während eines Exports gesperrt)
+EXPORT_MENU_LABEL = "Exportieren (PNG/SVG/PDF)"
+
+# Ab so vielen Zeilen zeichnet der Zoom nur den sichtbaren Ausschnitt neu
+ZOOM_SLICE_ROWS = 100_000
+# Große CSV: bis zu so vielen sichtbaren Zeilen liest der Zoom aus der Datei nach
+ZOOM_READ_ROWS = 200_000
+# Verzögerung (ms), bevor nach einer Zoom-Änderung nachgeladen wird
+ZOOM_DEBOUNCE_MS = 150
+# Abfrageintervall (ms) für laufende Hintergrund-Jobs
+POLL_MS = 100
+# Zeilen für den groben ersten Durchgang (Vorschau) großer Plots
+COARSE_ROWS = 2000
+
 
 class AppController:
     def __init__(self, root: tk.Tk):
@@ -33,19 +75,32 @@ class AppController:
         self.colinfo: dict | None = None
         self.current_csv_path: str | None = None
         self.plot_done: bool = False
+        self.source_col: str | None = None  # gesetzt, wenn mehrere Dateien geladen sind
+        self.lazy: bool = False             # Parquet/große CSV: Spalten erst beim Plotten lesen
+        self.row_index: dict | None = None  # Zeilenindex großer CSV-Dateien
+        self.n_rows = 0  # Zeilen laut Datei (lazy: aus Metadaten/Zeilenindex)
+        self._zoom_job = None
+        self._pyramid: dict | None = None      # Zeit-Buckets (Line/Stacked Area, Datum-X)
+        self._bucket_label: str | None = None  # aktuell gezeigte Bucket-Breite
+        self._stats_text = ""
+        self._plot_job: Job | None = None
+        self._spec: dict | None = None         # Auswahl des aktuell gezeigten Plots
+        self._export_pool = ThreadPoolExecutor(max_workers=1)
+        self._export_future = None             # laufender Export (höchstens einer)
 
 
         # Events verbinden
         self.ui.btn_open.configure(command=self.on_open_file)
         self.ui.btn_plot.configure(command=self.on_plot_clicked)
-        self.ui.btn_save.configure(command=self.on_save_png)
+        self.ui.btn_cancel.configure(command=self.on_cancel_clicked)
+        self.ui.btn_save.configure(command=self.on_export)
 
 
-        # Menüleiste (Speichern als PNG)
+        # Menüleiste (Export)
         menu = tk.Menu(root)
-        file_menu = tk.Menu(menu, tearoff=0)
-        file_menu.add_command(label="Speichern als PNG", command=self.on_save_png)
-        menu.add_cascade(label="Datei", menu=file_menu)
+        self._file_menu = tk.Menu(menu, tearoff=0)
+        self._file_menu.add_command(label=EXPORT_MENU_LABEL, command=self.on_export)
+        menu.add_cascade(label="Datei", menu=self._file_menu)
         root.config(menu=menu)
 
 
@@ -61,22 +116,76 @@ class AppController:
     # Datei laden
     # -----------------------------
     def on_open_file(self):
-        path = filedialog.askopenfilename(
-            title="CSV auswählen",
-            filetypes=[("CSV-Dateien", "*.csv"), ("Alle Dateien", "*.*")]
+        paths = filedialog.askopenfilenames(
+            title="Datei auswählen (Mehrfachauswahl möglich)",
+            filetypes=[
+                ("Alle unterstützten", "*.csv *.parquet *.pq *.arrow *.ipc *.feather"),
+                ("CSV-Dateien", "*.csv"),
+                ("Parquet-Dateien", "*.parquet *.pq"),
+                ("Arrow/Feather-Dateien", "*.arrow *.ipc *.feather"),
+                ("Alle Dateien", "*.*"),
+            ]
         )
-        if not path:
+        if not paths:
+            return
+        if len(paths) > 1:
+            self._open_many(list(paths))
             return
+        path = paths[0]
 
         try:
-            df = load_csv(path)
+            # Parquet/große CSV: nur Schema bzw. Zeilenindex; Daten liest erst der Plot
+            df, colinfo, n_rows, row_index = open_table(path)
         except Exception as ex:
             messagebox.showerror("Fehler beim Laden", str(ex))
             return
 
+        lazy = is_parquet(path) or row_index is not None
+        self._set_data(df, path, source_col=None, colinfo=colinfo, n_rows=n_rows,
+                       lazy=lazy, row_index=row_index)
+        self.ui.update_status(f"{'Geöffnet' if lazy else 'Geladen'}: {os.path.basename(path)} "
+                              f"({n_rows} Zeilen, {len(df.columns)} Spalten)")
+
+    def _open_many(self, paths: list[str]):
+        """Lädt mehrere Dateien parallel und hängt sie mit Quell-Spalte zusammen."""
+        try:
+            results, wall = load_many(paths)
+            df, dropped, source_col = combine_frames(results)
+        except Exception as ex:
+            messagebox.showerror("Fehler beim Laden", str(ex))
+            return
+
+        lines = ["DATEIEN (parallel geladen)"]
+        labels = source_labels([path for path, _d, _s in results])
+        for label, (_path, part, secs) in zip(labels, results):
+            lines.append(f"  {label}: {len(part)} Zeilen, {secs:.2f} s")
+        lines.append(f"  Summe Parse-Zeiten: {sum(s for _p, _d, s in results):.2f} s")
+        lines.append(f"  Gesamtzeit (Wall): {wall:.2f} s")
+        if dropped:
+            lines.append(f"  Nicht gemeinsame Spalten (verworfen): {', '.join(dropped)}")
+
+        if source_col != SOURCE_COL:
+            lines.append(f"  Quell-Spalte: {source_col} ('{SOURCE_COL}' existiert bereits)")
+        self._set_data(df, paths[0], source_col=source_col, extra_details=lines)
+        self.ui.update_status(f"Geladen: {len(results)} Dateien "
+                              f"({len(df)} Zeilen, {wall:.2f} s)")
+
+    def _set_data(self, df: pd.DataFrame, path: str, source_col: str | None,
+                  extra_details: list[str] | None = None, colinfo: dict | None = None,
+                  n_rows: int | None = None, lazy: bool = False, row_index: dict | None = None):
+        """
+        Übernimmt geladene Daten und setzt Auswahllisten/Details zurück.
+        colinfo: Spaltentypen aus dem Datei-Schema (sonst infer_columns)
+        lazy: df enthält nur das Schema (Parquet, große CSV); n_rows kommt aus
+        den Metadaten bzw. dem Zeilenindex (row_index, nur große CSV)
+        """
         self.df = df
         self.current_csv_path = path
-        self.colinfo = infer_columns(df)
+        self.source_col = source_col
+        self.lazy = lazy
+        self.row_index = row_index
+        self.n_rows = n_rows if n_rows is not None else len(df)
+        self.colinfo = colinfo if colinfo is not None else infer_columns(df)
         self.plot_done = False
 
         # Spaltenlisten füllen – ohne Vorauswahl
@@ -92,16 +201,16 @@ class AppController:
         categorical_count = len(self.colinfo.get("categorical", []))
         details = [
             "BASIS-STATISTIK",
-            f"  rows: {len(df)}",
+            f"  rows: {self.n_rows}",
             f"  cols: {len(df.columns)}",
             f"  #numeric: {numeric_count}",
             f"  #categorical: {categorical_count}",
             "",
-            "Wähle Diagrammtyp und Spalten, dann 'Plot erzeugen'.",
         ]
+        if extra_details:
+            details += extra_details + [""]
+        details.append("Wähle Diagrammtyp und Spalten, dann 'Plot erzeugen'.")
         self.ui.update_details("\n".join(details))
-        self.ui.update_status(f"Geladen: {os.path.basename(path)} "
-                              f"({len(df)} Zeilen, {len(df.columns)} Spalten)")
 
         # Plotbereich leeren
         self.ui.clear_plot()
@@ -122,7 +231,19 @@ class AppController:
         return cols
 
     def update_controls_state(self):
-        """Aktiviert/Deaktiviert den Plot-Button je nach Auswahl."""
+        """
+        Aktiviert/Deaktiviert den Plot-Button je nach Auswahl.
+        Eine geänderte Auswahl bricht einen laufenden Plot-Job ab – ist der
+        Plot schon gezeichnet, läuft nur noch dessen Statistik weiter.
+        """
+        if self._plot_job is not None and not self.plot_done:
+            self._cancel_plot_job("Plot abgebrochen (Auswahl geändert)")
+        # Min/Max-Band zeichnet nur Line – bei Stacked Area nicht anbieten
+        aggs = [a for a in RESAMPLE_AGGS
+                if a != "min-max" or self.ui.plot_type.get() != "Stacked Area"]
+        self.ui.cmb_time_agg["values"] = aggs
+        if self.ui.cmb_time_agg.get() not in aggs:
+            self.ui.cmb_time_agg.set("mean")
         ok, _msg = self.validate_selection(silent=True)
         self.ui.btn_plot.configure(state="normal" if ok else "disabled")
 
@@ -153,6 +274,8 @@ class AppController:
                 return False, "Stacked Area: Mindestens eine (besser zwei) Y-Spalten wählen."
             if not self._all_numeric(ys):
                 return False, "Stacked Area: Y-Spalten müssen numerisch sein."
+            if self.source_col is not None:
+                return False, "Stacked Area: Bei mehreren Dateien nicht verfügbar (Line nutzen)."
 
         elif ptype == "Pie":
             if not x:
@@ -194,41 +317,216 @@ class AppController:
             messagebox.showwarning("Auswahl prüfen", msg)
             return
 
-        # Zeichenbereich vorbereiten
-        self.ui.fig.clf()
-        ptype = self.ui.plot_type.get()
-
-        try:
-            if ptype == "Polar":
-                ax = self.ui.fig.add_subplot(111, projection="polar")
-            else:
-                ax = self.ui.fig.add_subplot(111)
-            self._draw_plot(ax)
-            self.ui.canvas.draw()
-            self.plot_done = True
-        except Exception as ex:
-            messagebox.showerror("Plot-Fehler", str(ex))
-            self.plot_done = False
+        # Datenaufbereitung + Statistik im Worker; gezeichnet wird im UI-Thread
+        if self._plot_job is not None:
+            self._cancel_plot_job()
+        spec = self._plot_spec()
+        job = Job(self._prepare_plot, spec).start()
+        self._plot_job = job
+        self.plot_done = False
+        self.ui.btn_cancel.configure(state="normal")
+        self.ui.update_status(f"{spec['ptype']}: Plot wird vorbereitet …")
+        self.ui.root.after(POLL_MS, lambda: self._poll_plot(job, spec))
+
+    def on_cancel_clicked(self):
+        if self._plot_job is not None:
+            self._cancel_plot_job("Plot abgebrochen")
+
+    def _cancel_plot_job(self, status: str | None = None):
+        """Bricht den laufenden Plot-Job ab; seine Ergebnisse werden verworfen."""
+        self._plot_job.cancel()
+        self._plot_job = None
+        self.ui.btn_cancel.configure(state="disabled")
+        if status:
+            self.ui.update_status(status)
+
+    def _plot_spec(self) -> dict:
+        """Momentaufnahme der Auswahl (der Worker liest keine Tk-Variablen)."""
+        sectors, polar_agg = self._polar_options()
+        return {
+            "df": self.df,
+            "lazy_path": self.current_csv_path if self.lazy else None,
+            "row_index": self.row_index,
+            "n_rows": self.n_rows,
+            "ptype": self.ui.plot_type.get(),
+            "x": self.get_selected_x(),
+            "ys": self.get_selected_ys(),
+            "source_col": self.source_col,
+            "sectors": sectors,
+            "polar_agg": polar_agg,
+            "time_agg": self.ui.cmb_time_agg.get() or "mean",
+        }
+
+    def _prepare_plot(self, job: Job, spec: dict):
+        """
+        Worker: bereitet die Plotdaten in Stufen auf.
+        0) lazy: nur X/Y-Spalten lesen (Parquet, große CSV); große CSV bzw.
+           sehr große Parquet-Datei bei Line/Stacked Area nur als Übersicht,
+           Details liest der Zoom
+        1) "coarse": jede n-te Zeile als schnelle Vorschau (nur große Line/Stacked Area/Histogram)
+        2) "full": benötigte Spalten numerisch + ggf. Zeit-Bucket-Pyramide bzw.
+           Pie-/Polar-Aggregate (der UI-Thread zeichnet nur noch)
+        3) "stats": Text für das Details-Panel
+        """
+        ptype, x, ys = spec["ptype"], spec["x"], spec["ys"]
+        cols = list(dict.fromkeys([c for c in [x, *ys, spec["source_col"]] if c]))
+        if spec["row_index"] is not None:
+            self._load_indexed(job, spec, cols)
+        elif spec["lazy_path"]:
+            self._load_parquet_lazy(job, spec, cols)
+        df = spec["df"]
+        if x and pd.api.types.is_datetime64_any_dtype(df[x]) and df[x].dt.tz is not None:
+            # Zeitzonen-X (z. B. Parquet/Arrow) als naive UTC: Zoom-Grenzen aus
+            # num2date(...).tz_localize(None) sind ebenfalls naive UTC
+            df = df[cols].copy(deep=False)
+            df[x] = df[x].dt.tz_convert(None)
+            spec["df"] = df
+
+        if ptype in ("Line", "Stacked Area", "Histogram") and len(df) > COARSE_ROWS:
+            step = math.ceil(len(df) / COARSE_ROWS)
+            job.post("coarse", {"df": df[cols].iloc[::step]})
+
+        # nur nicht-numerische Spalten konvertieren (Arrow-Puffer bleiben Sichten)
+        prepared = df[cols]
+        todo = [c for c in ys if not pd.api.types.is_numeric_dtype(prepared[c])]
+        if todo:
+            prepared = prepared.copy(deep=False)
+            for c in todo:
+                prepared[c] = pd.to_numeric(prepared[c], errors="coerce")
+        job.check()
+        pyramid = self._pyramid_for(spec, prepared)
+        aggregates = self._aggregates_for(spec, prepared)
+        job.post("full", {"df": prepared, "pyramid": pyramid, "aggregates": aggregates})
+
+        job.post("stats", self.compute_plot_stats(spec, aggregates))
+
+    @staticmethod
+    def _load_indexed(job: Job, spec: dict, cols: list[str]):
+        """
+        Worker, große CSV über den Zeilenindex:
+        - Line/Stacked Area: Übersicht aus verteilten Blöcken; bei sortierter
+          Zahlen-/Datums-X werden Min/Max je Block ergänzt (einmalig, danach
+          aus der Sidecar-Datei), damit der Zoom nur passende Blöcke liest
+        - sonst: nur die benötigten Spalten vollständig parsen
+        """
+        path, index, x = spec["lazy_path"], spec["row_index"], spec["x"]
+        if spec["ptype"] not in ("Line", "Stacked Area"):
+            spec["df"] = load_csv(path, columns=cols)
+            job.check()
             return
+        df = read_overview(path, index, cols)
+        job.check()
+        col = df[x]
+        if ((pd.api.types.is_numeric_dtype(col) or pd.api.types.is_datetime64_any_dtype(col))
+                and col.is_monotonic_increasing):
+            # Übersicht sortiert -> ganze Spalte prüfen (unsortiert: kein Nachlesen beim Zoom)
+            spec["x_blocks"] = index_sorted_column(path, index, x, check=job.check) is not None
+        spec["df"] = df
+        spec["sampled"] = True
+
+    @staticmethod
+    def _load_parquet_lazy(job: Job, spec: dict, cols: list[str]):
+        """
+        Worker, Parquet: nur die gewählten Spalten dekodieren (ersetzt den
+        Schema-Frame). Line/Stacked Area ab LAZY_PARQUET_ROWS Zeilen: nur
+        eine Übersicht; der Zoom liest passende Row-Groups nach.
+        """
+        path = spec["lazy_path"]
+        if spec["ptype"] in ("Line", "Stacked Area") and spec["n_rows"] >= LAZY_PARQUET_ROWS:
+            spec["df"] = read_parquet_overview(path, cols)
+            spec["sampled"] = True
+        else:
+            spec["df"] = load_parquet(path, columns=cols)
+        job.check()
 
-        # Plot-bezogene Statistik (nur Text)
-        try:
-            details_text = self.compute_plot_stats()
-            self.ui.update_details(details_text)
-        except Exception as ex:
-            self.ui.update_details(f"Statistik konnte nicht berechnet werden: {ex}")
-
-    def _draw_plot(self, ax):
-        """Ruft die passende plotter-Funktion auf."""
-        df = self.df
-        assert df is not None
+    def _poll_plot(self, job: Job, spec: dict):
+        """Holt Zwischenergebnisse des Plot-Jobs ab; veraltete Jobs werden ignoriert."""
+        if job is not self._plot_job:
+            return
+        while True:
+            try:
+                stage, payload = job.results.get_nowait()
+            except queue.Empty:
+                break
+            if stage in ("coarse", "full"):
+                try:
+                    self._show_stage(spec, payload, final=(stage == "full"))
+                except Exception as ex:
+                    self._cancel_plot_job()
+                    self.plot_done = False
+                    messagebox.showerror("Plot-Fehler", str(ex))
+                    return
+            elif stage == "stats":
+                self._stats_text = payload
+                self._show_plot_details()
+            elif stage == "error":
+                self._cancel_plot_job()
+                if self.plot_done:
+                    self.ui.update_details(f"Statistik konnte nicht berechnet werden: {payload}")
+                else:
+                    messagebox.showerror("Plot-Fehler", str(payload))
+                return
+            elif stage == "done":
+                self._plot_job = None
+                self.ui.btn_cancel.configure(state="disabled")
+                return
+        self.ui.root.after(POLL_MS, lambda: self._poll_plot(job, spec))
+
+    def _show_stage(self, spec: dict, payload: dict, final: bool):
+        """Zeichnet Vorschau bzw. endgültigen Plot (UI-Thread)."""
+        self._spec = spec
+        self.ui.fig.clf()
+        ptype = spec["ptype"]
+        if ptype == "Polar":
+            ax = self.ui.fig.add_subplot(111, projection="polar")
+        else:
+            ax = self.ui.fig.add_subplot(111)
+
+        self._pyramid = payload.get("pyramid")
+        self._bucket_label = None
+        if self._pyramid is not None:
+            t = payload["df"][spec["x"]]
+            part, band = self._bucket_view(t.min(), t.max())
+            self._draw_plot(ax, part, band)
+        else:
+            self._draw_plot(ax, payload["df"], aggregates=payload.get("aggregates"))
 
-        ptype = self.ui.plot_type.get()
-        x = self.get_selected_x()
-        ys = self.get_selected_ys()
+        if final:
+            if ptype in ("Line", "Stacked Area"):
+                ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+            self.plot_done = True
+            self._stats_text = "Statistik wird berechnet …"
+        else:
+            ax.set_title(ax.get_title() + " (Vorschau)")
+            self._stats_text = "Vorschau – vollständige Daten werden aufbereitet …"
+        self._show_plot_details()
+        self.ui.canvas.draw_idle()
+
+    def _show_plot_details(self):
+        """Plot-Statistik + aktuelle Bucket-Breite (ändert sich beim Zoomen)."""
+        text = self._stats_text
+        if self._bucket_label is not None:
+            text += f"\n\nZEIT-BUCKETS\n  Bucket-Breite: {self._bucket_label}"
+        self.ui.update_details(text)
+
+    def _draw_plot(self, ax, df=None, band=None, aggregates=None):
+        """
+        Ruft die passende plotter-Funktion auf.
+        df: optionaler Ausschnitt/Bucket-Frame, band: Min/Max-Band (nur Line)
+        aggregates: im Worker berechnete Pie-/Polar-Werte (s. _aggregates_for)
+        """
+        spec = self._spec
+        assert spec is not None
+        if df is None:
+            df = spec["df"]
+        if aggregates is None and spec["ptype"] in ("Pie", "Polar"):
+            aggregates = self._aggregates_for(spec, df)
+
+        ptype, x, ys = spec["ptype"], spec["x"], spec["ys"]
 
         if ptype == "Line":
-            plot_line(ax, df, x, ys)
+            # mehrere Dateien: je Quelle eine eigene Linie (Overlay)
+            plot_line(ax, df, x, ys, group_col=spec["source_col"], band=band)
             self.ui.update_status(f"Line: X={x}; Y={', '.join(ys)}")
 
         elif ptype == "Stacked Area":
@@ -236,7 +534,7 @@ class AppController:
             self.ui.update_status(f"Stacked Area: X={x}; Y={', '.join(ys)}")
 
         elif ptype == "Pie":
-            plot_pie(ax, df, label_col=x, value_col=ys[0], top_n=8)
+            plot_pie(ax, aggregates["pie"], top_n=8)
             self.ui.update_status(f"Pie: Labels={x}; Wert={ys[0]}")
 
         elif ptype == "Histogram":
@@ -245,22 +543,264 @@ class AppController:
             self.ui.update_status(f"Histogram: Y={ys[0]}")
 
         elif ptype == "Polar":
+            agg = spec["polar_agg"]
+            r, labels = aggregates["polar"]
+            plot_polar(ax, r, labels, agg=agg, n_values=aggregates["n_values"])
+            by = f"nach {x}" if x else "nach Position"
+            self.ui.update_status(f"Polar: Y={ys[0]}; Sektoren {by} ({agg})")
+
+    @staticmethod
+    def _aggregates_for(spec: dict, df: pd.DataFrame) -> dict | None:
+        """
+        Pie: Summe je Label; Polar: Sektorwerte (X optional als Kategorie-/
+        Datumsspalte für die Sektoren). Läuft im Plot-Worker; das Ergebnis
+        nutzen Zeichnen und Statistik gemeinsam.
+        """
+        ptype, x, ys = spec["ptype"], spec["x"], spec["ys"]
+        if ptype == "Pie":
+            return {"pie": aggregate_pie(df[x], df[ys[0]])}
+        if ptype == "Polar":
             s = pd.to_numeric(df[ys[0]], errors="coerce")
-            plot_polar(ax, s)
-            self.ui.update_status(f"Polar: Y={ys[0]}")
+            polar = aggregate_polar(s, sectors=spec["sectors"],
+                                    groups=df[x] if x else None, agg=spec["polar_agg"])
+            return {"polar": polar, "n_values": int(s.notna().sum())}
+        return None
+
+    def _polar_options(self) -> tuple[int | None, str]:
+        """Sektoranzahl (None = auto) und Aggregation aus der UI."""
+        try:
+            sectors = int(self.ui.polar_sectors.get())
+        except (tk.TclError, ValueError):
+            sectors = 0
+        return (sectors if sectors > 0 else None), self.ui.cmb_polar_agg.get() or "sum"
+
+    # -----------------------------
+    # Zeit-Buckets (Line/Stacked Area mit Datum-X)
+    # -----------------------------
+    @staticmethod
+    def _pyramid_for(spec: dict, df: pd.DataFrame) -> dict | None:
+        """Baut die Bucket-Pyramide, wenn X ein Datum ist und die Daten groß genug sind."""
+        x = spec["x"]
+        if (spec["ptype"] not in ("Line", "Stacked Area")
+                or spec["source_col"] is not None
+                or spec.get("sampled")  # Übersicht: Summen/Mittel wären verfälscht
+                or len(df) < RESAMPLE_MIN_ROWS
+                or not pd.api.types.is_datetime64_any_dtype(df[x])):
+            return None
+        return build_pyramid(df, x, spec["ys"])
+
+    def _bucket_view(self, lo: pd.Timestamp, hi: pd.Timestamp):
+        """
+        Daten für den sichtbaren Zeitbereich: passende Pyramidenstufe oder,
+        bei tiefem Zoom, die Rohzeilen aus dem geladenen DataFrame.
+        Rückgabe: (df, band)
+        """
+        assert self._spec is not None and self._pyramid is not None
+        width_px = self.ui.canvas_widget.winfo_width()
+        level = choose_level(self._pyramid, lo, hi, width_px)
+        if level is not None:
+            self._bucket_label = level["label"]
+            return level_frame(self._pyramid, level, self._spec["time_agg"], lo, hi)
+
+        self._bucket_label = "Rohdaten"
+        df = self._spec["df"]
+        t = df[self._spec["x"]]
+        if self._pyramid["sorted"]:
+            start = max(0, t.searchsorted(lo) - 1)
+            stop = t.searchsorted(hi, side="right") + 1
+            return df.iloc[start:stop], None
+        return df[(t >= lo) & (t <= hi)], None
+
+    # -----------------------------
+    # Zoom (Line/Stacked Area): sichtbarer Ausschnitt bzw. Zeit-Buckets
+    # -----------------------------
+    def _on_xlim_changed(self, ax):
+        """Zoom/Pan der Toolbar: Neuzeichnen entprellt anstoßen."""
+        if self._pyramid is None and not self._zoom_slices():
+            return
+        if self._zoom_job is not None:
+            self.ui.root.after_cancel(self._zoom_job)
+        self._zoom_job = self.ui.root.after(ZOOM_DEBOUNCE_MS, lambda: self._refresh_zoom(ax))
+
+    def _zoom_slices(self) -> bool:
+        """
+        Lohnt das Ausschneiden des sichtbaren Bereichs (eine Quelle und große
+        Daten bzw. Übersicht einer großen CSV-/Parquet-Datei, die der
+        Zoom nachliest)?
+        """
+        spec = self._spec
+        return (spec is not None and spec["source_col"] is None
+                and (spec.get("sampled") or len(spec["df"]) >= ZOOM_SLICE_ROWS))
+
+    def _visible_rows(self, ax) -> tuple[int, int] | None:
+        """
+        Zeilenbereich (Zeilennummern der Daten bzw. der Datei bei großen CSV),
+        der den sichtbaren X-Bereich abdeckt. None = unbekannt, z. B.
+        unsortierte Zahlen-X.
+        """
+        assert self._spec is not None
+        spec = self._spec
+        x = spec["x"]
+        lo, hi = ax.get_xlim()
+        col = spec["df"][x]
+        is_date = pd.api.types.is_datetime64_any_dtype(col)
+        if not (is_date or pd.api.types.is_numeric_dtype(col)):
+            # kategoriale X: Positionen entsprechen Zeilennummern
+            return max(0, int(lo) - 1), int(hi) + 2
+        if is_date:
+            lo = pd.Timestamp(mdates.num2date(lo)).tz_localize(None)
+            hi = pd.Timestamp(mdates.num2date(hi)).tz_localize(None)
+        if spec.get("sampled") and spec["row_index"] is not None:
+            # große CSV: Blöcke aus dem Zeilenindex (nur bei sortierter X)
+            if not spec.get("x_blocks"):
+                return None
+            if is_date:
+                lo, hi = float(lo.value), float(hi.value)
+            return x_range_to_rows(spec["row_index"], x, lo, hi)
+        if "x_sorted" not in spec:
+            spec["x_sorted"] = bool(col.is_monotonic_increasing)
+        if not spec["x_sorted"]:
+            return None
+        start = max(0, int(col.searchsorted(lo)) - 1)
+        return start, int(col.searchsorted(hi, side="right")) + 1
+
+    def _rows_part(self, rows: tuple[int, int]) -> pd.DataFrame | None:
+        """
+        Daten für den Zeilenbereich rows (None = alles, d. h. ganzer
+        DataFrame bzw. Übersicht). Große CSV: bis ZOOM_READ_ROWS Zeilen
+        werden über den Zeilenindex aus der Datei gelesen (ein seek() je
+        Bereich), Parquet: die abdeckenden Row-Groups (bis PARQUET_ZOOM_ROWS
+        Zeilen); bei größeren Bereichen reicht die Übersicht.
+        """
+        spec = self._spec
+        df = spec["df"]
+        start, stop = rows
+        if not spec.get("sampled"):
+            return None if stop - start >= len(df) else df.iloc[start:stop]
+        index = spec["row_index"]
+        if stop - start >= spec["n_rows"]:
+            return None
+        cols = list(dict.fromkeys([spec["x"], *spec["ys"]]))
+        if index is None:
+            # Parquet: nur die Row-Groups des Bereichs (sonst Übersicht)
+            part = read_parquet_rows(spec["lazy_path"], cols, start, stop, max_rows=PARQUET_ZOOM_ROWS)
+            if part is not None:
+                return part
+        elif stop - start <= ZOOM_READ_ROWS:
+            return read_rows(spec["lazy_path"], index, start, stop, columns=cols)
+        i, j = df.index.searchsorted(start), df.index.searchsorted(stop)
+        return df.iloc[i:j]
+
+    def _refresh_zoom(self, ax):
+        """
+        Zeichnet Line/Stacked Area für den sichtbaren Bereich neu.
+        Mit Zeit-Buckets: passende Pyramidenstufe (ohne Rohdaten-Scan).
+        Sonst nur den sichtbaren Ausschnitt (große CSV/Parquet: aus der
+        Datei nachgelesen); ist (fast) alles sichtbar, den ganzen DataFrame.
+        Unbekannter Bereich (unsortierte Zahlen-X): kein Neuzeichnen.
+        """
+        self._zoom_job = None
+        if self._spec is None or ax not in self.ui.fig.axes:
+            return
+        if self._pyramid is not None:
+            self._refresh_buckets(ax)
+            return
+        if not self._zoom_slices():
+            return
+        try:
+            if self._parquet_x_range():
+                part = self._parquet_range_part(ax)
+            else:
+                rows = self._visible_rows(ax)
+                if rows is None:
+                    return
+                part = self._rows_part(rows)
+            if part is not None and part.empty:
+                return
+            xlim, ylim = ax.get_xlim(), ax.get_ylim()
+            ax.cla()
+            self._draw_plot(ax, part)
+            ax.set_xlim(xlim)
+            ax.set_ylim(ylim)
+            ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+            self.ui.canvas.draw_idle()
+        except Exception as ex:
+            self.ui.update_status(f"Zoom-Neuzeichnen fehlgeschlagen: {ex}")
+
+    def _parquet_x_range(self) -> bool:
+        """Übersicht einer Parquet-Datei mit Zahlen-/Datums-X (Zoom per X-Filter)?"""
+        spec = self._spec
+        if not spec.get("sampled") or spec["row_index"] is not None:
+            return False
+        col = spec["df"][spec["x"]]
+        return pd.api.types.is_datetime64_any_dtype(col) or pd.api.types.is_numeric_dtype(col)
+
+    def _parquet_range_part(self, ax) -> pd.DataFrame:
+        """
+        Sichtbarer X-Bereich aus der Parquet-Datei: Row-Groups, deren
+        Min/Max-Statistik nicht passt, werden übersprungen. Bleiben mehr als
+        PARQUET_ZOOM_ROWS Zeilen, genügt der Ausschnitt der Übersicht.
+        """
+        spec = self._spec
+        x, df = spec["x"], spec["df"]
+        lo, hi = ax.get_xlim()
+        if pd.api.types.is_datetime64_any_dtype(df[x]):
+            lo = pd.Timestamp(mdates.num2date(lo)).tz_localize(None)
+            hi = pd.Timestamp(mdates.num2date(hi)).tz_localize(None)
+        cols = list(dict.fromkeys([x, *spec["ys"]]))
+        part = read_parquet_range(spec["lazy_path"], cols, x, lo, hi, max_rows=PARQUET_ZOOM_ROWS)
+        if part is None:
+            return df[df[x].between(lo, hi)]
+        if pd.api.types.is_datetime64_any_dtype(part[x]) and part[x].dt.tz is not None:
+            part[x] = part[x].dt.tz_convert(None)
+        return part
+
+    def _refresh_buckets(self, ax):
+        """
+        Zoom mit Zeit-Buckets: Stufe für den sichtbaren Bereich neu wählen.
+        Bei "sum" hängt die Größenordnung von der Bucket-Breite ab – wechselt
+        die Stufe, wird die Y-Achse neu skaliert (sonst bleibt sie stehen).
+        """
+        try:
+            xlim, ylim = ax.get_xlim(), ax.get_ylim()
+            lo = pd.Timestamp(mdates.num2date(xlim[0])).tz_localize(None)
+            hi = pd.Timestamp(mdates.num2date(xlim[1])).tz_localize(None)
+            previous = self._bucket_label
+            part, band = self._bucket_view(lo, hi)
+            if part.empty:
+                return
+            ax.cla()
+            self._draw_plot(ax, part, band)
+            ax.set_xlim(xlim)
+            if self._spec["time_agg"] == "sum" and self._bucket_label != previous:
+                ax.relim()
+                ax.autoscale_view(scalex=False)
+            else:
+                ax.set_ylim(ylim)
+            ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+            self.ui.canvas.draw_idle()
+            self._show_plot_details()
+        except Exception as ex:
+            self.ui.update_status(f"Zoom-Nachladen fehlgeschlagen: {ex}")
 
     # -----------------------------
     # Statistik (nur Text)
     # -----------------------------
-    def compute_plot_stats(self) -> str:
-        """Erstellt einen Textblock mit Statistik für den aktuellen Plot."""
-        assert self.df is not None
-        ptype = self.ui.plot_type.get()
-        x = self.get_selected_x()
-        ys = self.get_selected_ys()
-        df = self.df
+    def compute_plot_stats(self, spec: dict, aggregates: dict | None = None) -> str:
+        """
+        Erstellt einen Textblock mit Statistik für den Plot zu spec.
+        Läuft im Plot-Worker – keine Tk-Zugriffe.
+        aggregates: bereits berechnete Pie-/Polar-Werte (sonst neu berechnet)
+        """
+        ptype, x, ys, df = spec["ptype"], spec["x"], spec["ys"], spec["df"]
+        if aggregates is None and ptype in ("Pie", "Polar"):
+            aggregates = self._aggregates_for(spec, df)
 
         lines: list[str] = []
+        if spec.get("sampled"):
+            lines.append(f"ÜBERSICHT: Statistik aus {len(df)} von {spec['n_rows']} Zeilen "
+                         "(über die Datei verteilt)")
+            lines.append("")
 
         if ptype in ("Line", "Stacked Area", "Histogram"):
             lines.append("PLOT-STATISTIK")
@@ -285,10 +825,7 @@ class AppController:
                     lines.append("Histogram-Extras: keine gültigen Werte nach Cleaning.")
 
         elif ptype == "Pie":
-            vals = pd.to_numeric(df[ys[0]], errors="coerce")
-            lab = df[x].astype(str)
-            mask = vals.notna() & (vals > 0)
-            agg = vals[mask].groupby(lab[mask]).sum().sort_values(ascending=False)
+            agg = aggregates["pie"]
             k = min(8, len(agg))
             lines.append("PIE-STATISTIK")
             lines.append(f"  Kategorien: {len(agg)}")
@@ -308,35 +845,89 @@ class AppController:
             if len(s):
                 lines.append(f"  Summe: {float(s.sum())}")
                 lines.append(f"  Mittelwert: {float(s.mean())}")
-            s_sorted = s.sort_values(ascending=False)
+            agg = spec["polar_agg"]
+            r, _labels = aggregates["polar"]
+            if len(r) < len(s):
+                lines.append(f"  Sektoren: {len(r)} ({agg} {'nach ' + x if x else 'nach Position'})")
+            # Teilauswahl (nlargest) statt vollständiger Sortierung
             lines.append("  Top-8 Werte:")
-            for val in s_sorted.head(8).tolist():
+            for val in s.nlargest(8).tolist():
                 lines.append(f"    {val}")
 
         return "\n".join(lines).strip()
 
     # -----------------------------
-    # PNG speichern
+    # Export (PNG/SVG/PDF, im Hintergrund)
     # -----------------------------
-    def on_save_png(self):
+    def _set_export_state(self, state: str):
+        """Button und Menüeintrag gemeinsam sperren/freigeben."""
+        self.ui.btn_save.configure(state=state)
+        self._file_menu.entryconfigure(EXPORT_MENU_LABEL, state=state)
+
+    def on_export(self):
+        if self._export_future is not None and not self._export_future.done():
+            # z. B. per Menü/Tastatur ausgelöst, während noch exportiert wird
+            self.ui.update_status("Export läuft bereits …")
+            return
         if not self.plot_done:
             messagebox.showinfo("Hinweis", "Kein Plot zum Speichern. Bitte zuerst einen Plot erzeugen.")
             return
+        formats = [fmt for fmt, var in self.ui.export_formats.items() if var.get()]
+        if not formats:
+            messagebox.showinfo("Hinweis", "Bitte mindestens ein Exportformat wählen.")
+            return
         base = "plot"
         if self.current_csv_path:
             base = os.path.splitext(os.path.basename(self.current_csv_path))[0] + "_plot"
         path = filedialog.asksaveasfilename(
-            defaultextension=".png",
-            initialfile=f"{base}.png",
-            filetypes=[("PNG-Bild", "*.png")]
+            defaultextension=f".{formats[0]}",
+            initialfile=f"{base}.{formats[0]}",
+            filetypes=[(fmt.upper(), f"*.{fmt}") for fmt in formats]
         )
         if not path:
             return
+        base_path = os.path.splitext(path)[0]
+        # der Dialog fragt nur für den gewählten Pfad nach – übrige Formate hier prüfen
+        existing = [p for p in (f"{base_path}.{fmt}" for fmt in formats)
+                    if os.path.exists(p) and os.path.normcase(p) != os.path.normcase(path)]
+        if existing and not messagebox.askyesno(
+                "Überschreiben?",
+                "Folgende Dateien existieren bereits:\n"
+                + "\n".join(os.path.basename(p) for p in existing)
+                + "\n\nÜberschreiben?"):
+            return
+
+        # Snapshot im UI-Thread, Rendern/Schreiben im Worker
+        try:
+            snapshot = snapshot_figure(self.ui.fig)
+        except Exception as ex:
+            messagebox.showerror("Fehler beim Speichern", str(ex))
+            return
+        future = self._export_pool.submit(export_figure, snapshot, base_path, formats, 150)
+        self._export_future = future
+        self._set_export_state("disabled")
+        self.ui.update_status(f"Export läuft: {', '.join(f.upper() for f in formats)} …")
+        self.ui.root.after(POLL_MS, lambda: self._poll_export(future))
+
+    def _poll_export(self, future):
+        """Wartet (ohne zu blockieren) auf den Export-Worker."""
+        if not future.done():
+            self.ui.root.after(POLL_MS, lambda: self._poll_export(future))
+            return
+        self._export_future = None
+        self._set_export_state("normal")
         try:
-            self.ui.fig.savefig(path, dpi=150, bbox_inches="tight")
-            messagebox.showinfo("Gespeichert", f"PNG gespeichert: {os.path.basename(path)}")
+            results = future.result()
         except Exception as ex:
+            self.ui.update_status("Export fehlgeschlagen")
             messagebox.showerror("Fehler beim Speichern", str(ex))
+            return
+        lines = [
+            f"{os.path.basename(p)}: {secs:.2f} s, {size / 1024:.1f} KB"
+            for p, secs, size in results
+        ]
+        self.ui.update_status("Exportiert: " + "; ".join(lines))
+        messagebox.showinfo("Gespeichert", "\n".join(lines))
 
 
 # Make sure that the code inside runs only when the file is executed directly, not when it is imported as a module.
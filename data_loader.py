@@ -1,46 +1,215 @@
 # data_loader.py
 # ---------------------------------------------
-# Einfache Lade- und Hilfsfunktionen für CSV-Dateien.
+# Einfache Lade- und Hilfsfunktionen für CSV-Dateien
+# (optional auch Parquet / Arrow IPC / Feather über pyarrow).
 # Fokus: Lesbarkeit und Robustheit (für das Abschlussprojekt).
 # ---------------------------------------------
 
+import bisect
+import csv
+import datetime
+import io
+import json
+import math
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+# Muster für Zahlen- und Datumsformate (für die Locale-Erkennung)
+_RE_NUM_DOT = re.compile(r"^[+-]?\d+\.\d+$")                          # 14.1
+_RE_NUM_COMMA = re.compile(r"^[+-]?\d+,\d+$")                          # 14,1
+_RE_AMBIG_DOT = re.compile(r"^[+-]?\d{1,3}\.\d{3}$")                   # 1.234 (Dezimal oder Tausender?)
+_RE_AMBIG_COMMA = re.compile(r"^[+-]?\d{1,3},\d{3}$")                  # 1,234 (Dezimal oder Tausender?)
+_RE_DE_THOUSANDS = re.compile(r"^[+-]?\d{1,3}(\.\d{3})+(,\d+)?$")      # 1.234.567,8
+_RE_EN_THOUSANDS = re.compile(r"^[+-]?\d{1,3}(,\d{3})+(\.\d+)?$")      # 1,234,567.8
+
+# Zeilen der Textprobe für Trennzeichen-/Locale-Erkennung
+SAMPLE_LINES = 200
+
+_DATE_FORMATS = [
+    (re.compile(r"^\d{4}-\d{2}-\d{2}$"), "%Y-%m-%d"),
+    (re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$"), "%Y-%m-%dT%H:%M:%S"),
+    (re.compile(r"^\d{4}-\d{2}$"), "%Y-%m"),
+    (re.compile(r"^\d{2}\.\d{2}\.\d{4}$"), "%d.%m.%Y"),
+    (re.compile(r"^\d{2}/\d{2}/\d{4}$"), "%d/%m/%Y"),
+]
+
 def _detect_sep(sample):
     """
     Ermittelt ein wahrscheinliches Trennzeichen aus einer Textprobe.
-    Sehr einfache Heuristik: prüft gängige Kandidaten.
+    Sehr einfache Heuristik: prüft gängige Kandidaten – zuerst in der
+    Kopfzeile (dort stehen keine Dezimalkommas), sonst in der ganzen Probe.
     """
     candidates = [",", ";", "\t", "|", ":"]
-    counts = {c: sample.count(c) for c in candidates}
-    best = max(counts, key=counts.get)
-    return best if counts[best] > 0 else ","
+    for text in (sample.split("\n", 1)[0], sample):
+        counts = {c: text.count(c) for c in candidates}
+        best = max(counts, key=counts.get)
+        if counts[best] > 0:
+            return best
+    return ","
+
+def _classify_number(tok):
+    """Ordnet ein Token einer Zahlen-Schreibweise zu (oder None)."""
+    if _RE_AMBIG_DOT.match(tok):
+        return "ambig_dot"
+    if _RE_AMBIG_COMMA.match(tok):
+        return "ambig_comma"
+    if _RE_NUM_DOT.match(tok):
+        return "dot"
+    if _RE_NUM_COMMA.match(tok):
+        return "comma"
+    if _RE_DE_THOUSANDS.match(tok):
+        return "de_thousands"
+    if _RE_EN_THOUSANDS.match(tok):
+        return "en_thousands"
+    return None
+
+def _detect_locale(sample, sep):
+    """
+    Ermittelt Dezimal- und Tausendertrennzeichen sowie Datumsformate
+    aus derselben Textprobe wie _detect_sep.
+    - "1.234"/"1,234" sind mehrdeutig und zählen nicht als Stimme; ohne
+      eindeutige Zahlen entscheiden ';' als Trennzeichen oder TT.MM.JJJJ-Daten
+    - bei Dezimalkomma wird der Tausenderpunkt nur aktiviert, wenn die Probe
+      "1.234"/"1.234.567,8" enthält (sonst würde ein "1.5" still zu 15)
+    - comma_columns: Spalten mit (in Anführungszeichen stehenden)
+      Dezimalkomma-Werten in einer Datei mit Dezimalpunkt bzw. mit
+      gemischtem Dezimalkomma/-punkt in einer Datei mit Dezimalkomma
+    Rückgabe: {"decimal", "thousands", "dates": {spalte: format}, "comma_columns": [...]}
+    """
+    rows = list(csv.reader(io.StringIO(sample), delimiter=sep))
+    if not rows:
+        return {"decimal": ".", "thousands": None, "dates": {}, "comma_columns": []}
+    header, body = rows[0], rows[1:]
+
+    votes = {k: 0 for k in ("dot", "comma", "ambig_dot", "ambig_comma", "de_thousands", "en_thousands")}
+    col_kinds = {}
+    date_hits = {}
+    for row in body:
+        for i, cell in enumerate(row):
+            tok = cell.strip()
+            if not tok:
+                continue
+            kind = _classify_number(tok)
+            if i < len(header):
+                col_kinds.setdefault(header[i], []).append(kind)
+            if kind is not None:
+                votes[kind] += 1
+            elif i < len(header):
+                for pattern, fmt in _DATE_FORMATS:
+                    if pattern.match(tok):
+                        date_hits.setdefault(header[i], set()).add(fmt)
+                        break
 
-def load_csv(path):
+    # Nur Spalten mit genau einem erkannten Format übernehmen
+    dates = {col: fmts.pop() for col, fmts in date_hits.items() if len(fmts) == 1}
+
+    de_votes = votes["comma"] + votes["de_thousands"]
+    en_votes = votes["dot"] + votes["en_thousands"]
+    if de_votes == en_votes:
+        # keine eindeutigen Zahlen: übrige Hinweise auf deutsches Format
+        german = sep == ";" or "%d.%m.%Y" in dates.values()
+    else:
+        german = de_votes > en_votes
+
+    # Dezimalkomma nur, wenn es nicht gleichzeitig das Trennzeichen ist
+    comma_columns = []
+    if sep != "," and german:
+        decimal = ","
+        thousands = "." if votes["de_thousands"] or votes["ambig_dot"] else None
+        if thousands is None:
+            # gemischte Schreibweise ("2,5" und "1.5") in einer Spalte: nachträglich umwandeln
+            for col, kinds in col_kinds.items():
+                if "dot" in kinds and all(k in ("comma", "dot") for k in kinds):
+                    comma_columns.append(col.strip())
+    else:
+        decimal = "."
+        thousands = "," if sep != "," and (votes["en_thousands"] or votes["ambig_comma"]) else None
+        for col, kinds in col_kinds.items():
+            if (all(k in ("comma", "ambig_comma", "de_thousands") for k in kinds)
+                    and any(k != "ambig_comma" for k in kinds)):
+                comma_columns.append(col.strip())
+
+    return {"decimal": decimal, "thousands": thousands, "dates": dates,
+            "comma_columns": comma_columns}
+
+def _apply_comma_columns(df, fmt):
+    """
+    Wandelt Dezimalkomma-Spalten um, die read_csv nicht konvertiert hat
+    (z. B. "14,1" in einer ','-getrennten Datei oder "1.5" zwischen
+    "2,5"-Werten). Vektorisiert; eine Spalte wird nur übernommen, wenn
+    sich alle Werte umwandeln lassen.
+    """
+    for col in fmt.get("comma_columns", []):
+        if col not in df.columns or pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        s = df[col]
+        text = s.astype(str)
+        if fmt.get("decimal") != ",":
+            # Datei mit Dezimalpunkt: Punkte sind hier Tausendertrennzeichen
+            text = text.str.replace(".", "", regex=False)
+        conv = pd.to_numeric(text.str.replace(",", ".", regex=False), errors="coerce")
+        if conv.notna().sum() == s.notna().sum():
+            df[col] = conv
+    return df
+
+def _sniff_format(path):
+    """
+    Liest eine kleine Probe und ermittelt Trennzeichen + Locale.
+    Rückgabe: {"sep", "decimal", "thousands", "dates", "comma_columns"}
+    (JSON-tauglich, s. Zeilenindex)
+    """
+    # utf-8-sig: BOM (Excel-Export) nicht im ersten Spaltennamen mitführen
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        sample = "".join([next(f, "") for _ in range(SAMPLE_LINES)])
+    sep = _detect_sep(sample)
+    fmt = {"sep": sep}
+    fmt.update(_detect_locale(sample, sep))
+    return fmt
+
+def _read_options(fmt, columns=None):
+    """
+    Gemeinsame read_csv-Parameter für Voll- und Teil-Lesen.
+    columns (optional): nur diese Spalten lesen (Namen ohne Randleerzeichen)
+    """
+    dates = fmt["dates"]
+    opts = {"encoding": "utf-8"}
+    if columns is not None:
+        wanted = set(columns)
+        dates = {c: f for c, f in dates.items() if c.strip() in wanted}
+        opts["usecols"] = lambda c: c.strip() in wanted
+    opts.update({
+        "sep": fmt["sep"],
+        "decimal": fmt["decimal"],
+        "thousands": fmt["thousands"],
+        "parse_dates": list(dates) or False,
+        "date_format": dates or None,
+        "engine": "c",
+    })
+    return opts
+
+def load_csv(path, columns=None):
     """
     Liest eine CSV-Datei als DataFrame.
     - UTF-8
     - einfacher Separator-Check (Heuristik)
-    - engine='python' um flexible Trennzeichen zu erlauben
+    - Locale-Erkennung (Dezimal-/Tausendertrennzeichen, Datumsformate),
+      damit Zahlen und Datumswerte direkt beim Parsen konvertiert werden
+    - columns (optional): nur diese Spalten parsen
     Wirft eine Exception mit verständlicher Nachricht, falls etwas schiefgeht.
     """
     try:
-        # Kleine Probe lesen, um das Trennzeichen zu schätzen
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            sample = "".join([next(f, "") for _ in range(20)])
-
-        sep = _detect_sep(sample)
-
-        df = pd.read_csv(
-            path,
-            encoding="utf-8",
-            sep=sep,
-            engine="python"
-        )
+        fmt = _sniff_format(path)
+        df = pd.read_csv(path, **_read_options(fmt, columns))
 
         # Optional: Whitespace in Spaltennamen entfernen
         df.columns = [c.strip() for c in df.columns]
-        return df
+        return _apply_comma_columns(df, fmt)
 
     except FileNotFoundError:
         raise RuntimeError("Datei wurde nicht gefunden. Bitte Pfad prüfen.")
@@ -49,6 +218,602 @@ def load_csv(path):
     except Exception as ex:
         raise RuntimeError(f"CSV konnte nicht geladen werden: {ex}")
 
+# ---------------------------------------------
+# Mehrere Dateien gleichzeitig laden
+# ---------------------------------------------
+
+SOURCE_COL = "Quelle"
+
+def _timed_load(path):
+    t0 = time.perf_counter()
+    df = load_table(path)
+    return df, time.perf_counter() - t0
+
+def load_many(paths, max_workers=None):
+    """
+    Lädt mehrere Dateien (CSV/Parquet/Arrow) parallel (Thread-Pool; der
+    C-Parser von pandas und pyarrow geben beim Einlesen den GIL frei).
+    Rückgabe: (Liste von (pfad, df, sekunden) in Eingabereihenfolge, Gesamtzeit)
+    Wirft RuntimeError mit Dateiname, wenn eine Datei nicht geladen werden kann.
+    """
+    paths = list(paths)
+    if not paths:
+        return [], 0.0
+    workers = max_workers or min(len(paths), (os.cpu_count() or 1) + 4)
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_timed_load, p) for p in paths]
+        results = []
+        for path, fut in zip(paths, futures):
+            try:
+                df, secs = fut.result()
+            except Exception as ex:
+                raise RuntimeError(f"{os.path.basename(path)}: {ex}")
+            results.append((path, df, secs))
+    return results, time.perf_counter() - t0
+
+def source_labels(paths):
+    """
+    Eindeutige Kurznamen für Dateien: Dateiname, bei Gleichnamigen so viele
+    übergeordnete Ordner wie nötig (z. B. "2023/daten.csv", "2024/daten.csv").
+    """
+    parts = [os.path.normpath(os.path.abspath(p)).split(os.sep) for p in paths]
+    depth = [1] * len(paths)
+    while True:
+        labels = ["/".join(pp[-d:]) for pp, d in zip(parts, depth)]
+        clash = {l for l in labels if labels.count(l) > 1}
+        grow = [i for i, l in enumerate(labels) if l in clash and depth[i] < len(parts[i])]
+        if not grow:
+            return labels
+        for i in grow:
+            depth[i] += 1
+
+def _free_column_name(name, frames):
+    """name bzw. name_1, name_2, ... – kein Spaltenname einer der Dateien."""
+    taken = {str(c) for f in frames for c in f.columns}
+    candidate, i = name, 0
+    while candidate in taken:
+        i += 1
+        candidate = f"{name}_{i}"
+    return candidate
+
+def combine_frames(results, source_col=SOURCE_COL):
+    """
+    Richtet mehrere DataFrames am Schema aus und hängt sie untereinander.
+    - gemeinsame Spalten (Reihenfolge der ersten Datei) bleiben erhalten
+    - neue Quell-Spalte mit eindeutigem Dateilabel (für Overlay im Line-Plot);
+      gibt es source_col schon in einer Datei, wird ein freier Name gewählt
+    Rückgabe: (df, verworfene Spalten, Name der Quell-Spalte)
+    """
+    frames = [df for _path, df, _secs in results]
+    common = [c for c in frames[0].columns if all(c in f.columns for f in frames[1:])]
+    if not common:
+        raise RuntimeError("Die Dateien haben keine gemeinsamen Spalten.")
+    dropped = sorted({c for f in frames for c in f.columns} - set(common))
+    source_col = _free_column_name(source_col, frames)
+    labels = source_labels([path for path, _df, _secs in results])
+    parts = []
+    for label, df in zip(labels, frames):
+        part = df[common].copy()
+        part[source_col] = label
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True), dropped, source_col
+
+# ---------------------------------------------
+# Zeilenindex (Sidecar-Datei) für Teil-Lesen
+# ---------------------------------------------
+# Für jede k-te Datenzeile wird der Byte-Offset gespeichert. Ist eine
+# Spalte aufsteigend sortiert, kommen Min/Max je Block dazu. Damit lässt
+# sich ein Zeilenbereich oder X-Intervall einer nicht geladenen Datei mit
+# einem seek() + kleinem Parse lesen. Zeilenumbrüche in Anführungszeichen
+# und Leerzeilen werden wie von pandas behandelt (kein Datensatz-Ende bzw.
+# keine Datenzeile); passt die Zeilenzahl trotzdem nicht zum geladenen
+# DataFrame, wird kein Index erstellt.
+# Große CSV-Dateien (ab LAZY_CSV_BYTES) öffnet open_table nur über den
+# Index: Übersicht aus verteilten Blöcken, Details liest der Zoom nach.
+
+INDEX_BLOCK_ROWS = 10_000
+INDEX_VERSION = 2
+_INDEX_SUFFIX = ".idx.json"
+
+LAZY_CSV_BYTES = 256 * 2**20   # ab dieser Dateigröße nicht vollständig laden
+HEAD_ROWS = 10_000             # Zeilen für die Spaltentyp-Erkennung großer Dateien
+OVERVIEW_ROWS = 200_000        # Zeilen der Übersicht großer Dateien
+OVERVIEW_READS = 400           # höchstens so viele seek()+Parse-Vorgänge dafür
+LAZY_PARQUET_ROWS = 20_000_000 # Parquet (Line/Stacked Area): ab hier Übersicht + Nachlesen
+PARQUET_ZOOM_ROWS = 2_000_000  # höchstens so viele Zeilen liest der Zoom aus Row-Groups
+
+def _index_path(path):
+    return path + _INDEX_SUFFIX
+
+def _scan_line_offsets(path, block_rows, chunk_size=1 << 24):
+    """
+    Liefert (header_end, offsets, n_rows): Byte-Offsets jeder block_rows-ten
+    Datenzeile. Vektorisiert (numpy) in großen Blöcken:
+    - Zeilenenden innerhalb von Anführungszeichen (ungerade Anzahl '"'
+      davor) beenden keinen Datensatz
+    - Leerzeilen ("" bzw. "\\r") zählen nicht als Datenzeile
+    - eine letzte Zeile ohne Zeilenende zählt mit
+    """
+    offsets = []
+    n_rows = 0
+    pos = 0              # Byte-Position des aktuellen Blocks
+    quotes = 0           # Anzahl '"' vor dem aktuellen Block
+    rec_start = 0        # Beginn des laufenden Datensatzes
+    prev_byte = 10       # letztes Byte des vorigen Blocks
+    header_end = None
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buf = np.frombuffer(chunk, dtype=np.uint8)
+            q = np.cumsum(buf == 34) + quotes
+            nl = np.flatnonzero(buf == 10)
+            nl = nl[q[nl] % 2 == 0]
+            if nl.size:
+                ends = nl + pos
+                starts = np.concatenate(([rec_start], ends[:-1] + 1))
+                before = np.where(nl > 0, buf[np.maximum(nl - 1, 0)], prev_byte)
+                length = ends - starts
+                blank = (length == 0) | ((length == 1) & (before == 13))
+                if header_end is None:
+                    header_end = int(ends[0]) + 1
+                    starts, blank = starts[1:], blank[1:]
+                data = starts[~blank]
+                row_no = np.arange(n_rows, n_rows + data.size)
+                offsets.extend(int(o) for o in data[row_no % block_rows == 0])
+                n_rows += data.size
+                rec_start = int(ends[-1]) + 1
+            quotes = int(q[-1])
+            prev_byte = int(buf[-1])
+            pos += len(chunk)
+
+    # letzte Zeile ohne Zeilenende
+    tail = pos - rec_start
+    if tail > 0 and not (tail == 1 and prev_byte == 13):
+        if header_end is None:
+            header_end = pos
+        else:
+            if n_rows % block_rows == 0:
+                offsets.append(rec_start)
+            n_rows += 1
+    return header_end if header_end is not None else pos, offsets, n_rows
+
+def _block_bounds(values, block_rows):
+    """Min/Max je Block für eine aufsteigend sortierte Spalte (erstes/letztes Element)."""
+    starts = values[::block_rows]
+    ends = values[block_rows - 1::block_rows]
+    if len(ends) < len(starts):
+        ends = np.append(ends, values[-1])
+    return starts.tolist(), ends.tolist()
+
+def _index_key(x):
+    """Spalte -> float64-Werte für den Index (Datum als ns seit Epoche)."""
+    if pd.api.types.is_datetime64_any_dtype(x):
+        return x.values.astype("datetime64[ns]").astype("int64").astype("float64"), "datetime"
+    return x.values.astype("float64"), "number"
+
+def build_row_index(path, df=None, block_rows=INDEX_BLOCK_ROWS):
+    """
+    Erstellt den Zeilenindex für eine CSV-Datei.
+    - df (optional): bereits geladener DataFrame, um sortierte Spalten und
+      Min/Max je Block ohne erneutes Parsen zu bestimmen
+    Rückgabe: dict (wird als JSON neben der Datei abgelegt) oder None, wenn
+    die gezählten Datenzeilen nicht zu df passen (Index wäre unzuverlässig)
+    """
+    st = os.stat(path)
+    fmt = _sniff_format(path)
+    header_end, offsets, n_rows = _scan_line_offsets(path, block_rows)
+    if df is not None and len(df) != n_rows:
+        return None
+    with open(path, "rb") as f:
+        head = f.read(header_end).decode("utf-8-sig", errors="replace")
+    header = next(csv.reader(io.StringIO(head), delimiter=fmt["sep"]), [])
+
+    columns = {}
+    if df is not None:
+        for col in df.columns:
+            x = df[col]
+            if not (pd.api.types.is_numeric_dtype(x) or pd.api.types.is_datetime64_any_dtype(x)):
+                continue
+            if x.isna().any() or not x.is_monotonic_increasing:
+                continue
+            values, kind = _index_key(x)
+            lo, hi = _block_bounds(values, block_rows)
+            columns[col] = {"kind": kind, "min": lo, "max": hi}
+
+    return {
+        "version": INDEX_VERSION,
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "format": fmt,
+        "header": header,
+        "header_end": header_end,
+        "block_rows": block_rows,
+        "n_rows": n_rows,
+        "offsets": offsets,
+        "sorted_columns": columns,
+    }
+
+def load_row_index(path, df=None, block_rows=INDEX_BLOCK_ROWS):
+    """
+    Liefert den Zeilenindex aus der Sidecar-Datei (<csv>.idx.json).
+    Neu aufgebaut wird, wenn die Datei fehlt oder Größe/mtime der CSV
+    nicht mehr passen. Ist das Verzeichnis schreibgeschützt, bleibt der
+    Index nur im Speicher. None, wenn kein zuverlässiger Index möglich ist.
+    """
+    st = os.stat(path)
+    try:
+        with open(_index_path(path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if (index.get("version") == INDEX_VERSION
+                and index.get("size") == st.st_size
+                and index.get("mtime") == st.st_mtime
+                and index.get("block_rows") == block_rows
+                and (df is None or index.get("n_rows") == len(df))):
+            return index
+    except (OSError, ValueError):
+        pass
+
+    index = build_row_index(path, df, block_rows)
+    if index is None:
+        return None
+    _save_row_index(path, index)
+    return index
+
+def _save_row_index(path, index):
+    """Schreibt die Sidecar-Datei (schreibgeschütztes Verzeichnis: nur im Speicher)."""
+    try:
+        with open(_index_path(path), "w", encoding="utf-8") as f:
+            json.dump(index, f)
+    except OSError:
+        pass
+
+def index_sorted_column(path, index, col, check=None):
+    """
+    Ergänzt den Index um Min/Max je Block für Spalte col, sofern sie
+    aufsteigend sortiert ist und keine Lücken hat. Einmaliger Durchlauf
+    über nur diese Spalte in Blöcken zu block_rows Zeilen; das Ergebnis
+    (auch "unsortiert") landet in der Sidecar-Datei.
+    check (optional): wird je Block aufgerufen (z. B. Job-Abbruch).
+    Rückgabe: Eintrag aus sorted_columns oder None.
+    """
+    if col in index["sorted_columns"]:
+        return index["sorted_columns"][col]
+    if col in index.get("unsorted_columns", []):
+        return None
+    lo, hi, kind, last = [], [], None, -np.inf
+    ok = True
+    opts = _read_options(index["format"], [col])
+    with pd.read_csv(path, chunksize=index["block_rows"], **opts) as reader:
+        for chunk in reader:
+            if check is not None:
+                check()
+            x = chunk.iloc[:, 0]
+            if not (pd.api.types.is_numeric_dtype(x) or pd.api.types.is_datetime64_any_dtype(x)):
+                ok = False
+            elif x.isna().any():
+                ok = False
+            else:
+                values, kind = _index_key(x)
+                ok = values[0] >= last and bool(np.all(np.diff(values) >= 0))
+            if not ok:
+                break
+            lo.append(float(values[0]))
+            hi.append(float(values[-1]))
+            last = values[-1]
+    if ok and lo and len(lo) == len(index["offsets"]):
+        index["sorted_columns"][col] = {"kind": kind, "min": lo, "max": hi}
+    else:
+        index.setdefault("unsorted_columns", []).append(col)
+    _save_row_index(path, index)
+    return index["sorted_columns"].get(col)
+
+def read_rows(path, index, start, stop, columns=None):
+    """
+    Liest die Datenzeilen [start, stop) über den Zeilenindex:
+    ein seek() zum Blockanfang, dann nur bis stop parsen.
+    columns (optional): nur diese Spalten; der DataFrame-Index enthält
+    die Zeilennummern der Datei.
+    """
+    start = max(0, int(start))
+    stop = min(index["n_rows"], int(stop))
+    header = index["header"]
+    if stop <= start:
+        names = [c.strip() for c in header]
+        return pd.DataFrame(columns=[c for c in names if columns is None or c in columns])
+
+    k = index["block_rows"]
+    block = start // k
+    opts = _read_options(index["format"], columns)
+    with open(path, "rb") as f:
+        f.seek(index["offsets"][block])
+        # nrows zählt Datensätze (wie beim Index ohne Leerzeilen)
+        df = pd.read_csv(f, header=None, names=header, nrows=stop - block * k, **opts)
+    df = df.iloc[start - block * k:]
+    df.columns = [c.strip() for c in df.columns]
+    _apply_comma_columns(df, index["format"])
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+def read_overview(path, index, columns=None, max_rows=OVERVIEW_ROWS, max_reads=OVERVIEW_READS):
+    """
+    Übersicht einer großen Datei ohne Voll-Parse: aus höchstens max_reads
+    gleichmäßig verteilten Blöcken jeweils die ersten Zeilen (zusammen etwa
+    max_rows). Der DataFrame-Index enthält die Zeilennummern der Datei.
+    """
+    n_blocks = len(index["offsets"])
+    if n_blocks == 0:
+        return read_rows(path, index, 0, 0, columns)
+    k = index["block_rows"]
+    picks = np.unique(np.linspace(0, n_blocks - 1, num=min(n_blocks, max_reads)).astype(int))
+    per_block = max(1, min(k, max_rows // len(picks)))
+    return pd.concat([read_rows(path, index, b * k, b * k + per_block, columns) for b in picks])
+
+def x_range_to_rows(index, col, lo, hi):
+    """
+    Übersetzt ein X-Intervall [lo, hi] einer sortierten Spalte in einen
+    Zeilenbereich (start, stop) auf Blockgrenzen. None, wenn die Spalte
+    nicht im Index steht (unsortiert/unbekannt).
+    lo/hi: Zahlen bzw. ns seit Epoche bei Datumsspalten.
+    """
+    info = index["sorted_columns"].get(col)
+    if info is None:
+        return None
+    k = index["block_rows"]
+    first = bisect.bisect_left(info["max"], lo)
+    last = bisect.bisect_right(info["min"], hi)
+    return first * k, min(index["n_rows"], last * k)
+
+# ---------------------------------------------
+# Parquet / Arrow IPC / Feather (optional: pyarrow)
+# ---------------------------------------------
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".arrow", ".ipc", ".feather")
+
+def _import_pyarrow():
+    """pyarrow wird nur für Parquet/Arrow benötigt (optionales Paket)."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        import pyarrow.feather
+    except ImportError:
+        raise RuntimeError("Für Parquet/Arrow-Dateien wird 'pyarrow' benötigt (pip install pyarrow).")
+    return pyarrow
+
+def is_parquet(path):
+    return os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS
+
+def is_arrow(path):
+    return os.path.splitext(path)[1].lower() in ARROW_EXTENSIONS
+
+def _to_pandas(table):
+    """
+    Arrow-Tabelle -> DataFrame. split_blocks verhindert das Zusammenkopieren
+    in 2D-Blöcke; numerische Spalten ohne Nullwerte bleiben so Sichten auf
+    den Arrow-Puffer (bei Arrow IPC also auf die memory-mapped Datei).
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def _read_arrow_table(pa, path, columns=None):
+    """
+    Arrow-Tabelle memory-mapped lesen: IPC-File-Format bzw. Feather v1/v2,
+    sonst als IPC-Stream (z. B. aus RecordBatchStreamWriter).
+    """
+    try:
+        return pa.feather.read_table(path, columns=columns, memory_map=True)
+    except pa.ArrowInvalid:
+        # kein File-Format: als Stream lesen (Puffer bleiben Sichten auf die Datei)
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_stream(source).read_all()
+        return table.select(columns) if columns is not None else table
+
+def _load_arrow_table(path, columns=None):
+    """Wie load_arrow, liefert aber (df, schema) – Fehler als RuntimeError."""
+    pa = _import_pyarrow()
+    try:
+        table = _read_arrow_table(pa, path, columns)
+        schema = table.schema  # vor _to_pandas (self_destruct gibt die Tabelle frei)
+        df = _to_pandas(table)
+        df.columns = [str(c).strip() for c in df.columns]
+        return df, schema
+    except FileNotFoundError:
+        raise RuntimeError("Datei wurde nicht gefunden. Bitte Pfad prüfen.")
+    except Exception as ex:
+        raise RuntimeError(f"Arrow-Datei konnte nicht geladen werden: {ex}")
+
+def load_arrow(path, columns=None):
+    """
+    Liest eine Arrow-IPC-Datei (File- oder Stream-Format) bzw. Feather-Datei
+    memory-mapped. Es wird nichts geparst; Zahlenspalten zeigen direkt auf die Datei.
+    """
+    return _load_arrow_table(path, columns)[0]
+
+def _parquet_columns(pa, path, columns):
+    """DataFrame-Spaltennamen (ohne Randleerzeichen) -> Namen in der Datei."""
+    if columns is None:
+        return None
+    names = {str(n).strip(): n for n in pa.parquet.read_schema(path).names}
+    return [names.get(c, c) for c in columns]
+
+def _parquet_frame(table, index=None):
+    df = _to_pandas(table)
+    df.columns = [str(c).strip() for c in df.columns]
+    if index is not None:
+        df.index = index
+    return df
+
+def load_parquet(path, columns=None, filters=None):
+    """
+    Liest eine Parquet-Datei.
+    - columns: Spaltenprojektion (nur diese Spalten werden dekodiert);
+      Namen wie im DataFrame (ohne Leerzeichen am Rand)
+    - filters: pyarrow-Ausdruck; Row-Groups, deren Min/Max-Statistik nicht
+      passt, werden übersprungen
+    """
+    pa = _import_pyarrow()
+    try:
+        table = pa.parquet.read_table(path, columns=_parquet_columns(pa, path, columns),
+                                      filters=filters, memory_map=True)
+        return _parquet_frame(table)
+    except FileNotFoundError:
+        raise RuntimeError("Datei wurde nicht gefunden. Bitte Pfad prüfen.")
+    except Exception as ex:
+        raise RuntimeError(f"Parquet-Datei konnte nicht geladen werden: {ex}")
+
+def read_parquet_overview(path, columns, max_rows=OVERVIEW_ROWS):
+    """
+    Übersicht großer Parquet-Dateien: jede n-te Zeile, Batch für Batch
+    gelesen (der Speicher bleibt klein). Der DataFrame-Index enthält die
+    Zeilennummern der Datei.
+    """
+    pa = _import_pyarrow()
+    pf = pa.parquet.ParquetFile(path, memory_map=True)
+    step = max(1, math.ceil(pf.metadata.num_rows / max_rows))
+    parts, pos = [], 0
+    for batch in pf.iter_batches(columns=_parquet_columns(pa, path, columns)):
+        take = np.arange((-pos) % step, batch.num_rows, step)
+        table = pa.Table.from_batches([batch.take(pa.array(take))])
+        parts.append(_parquet_frame(table, pd.Index(pos + take)))
+        pos += batch.num_rows
+    if not parts:
+        return load_parquet(path, columns)
+    return pd.concat(parts)
+
+def _stat_value(value):
+    """Row-Group-Statistik -> vergleichbarer Wert (Datum als naive UTC)."""
+    if isinstance(value, (pd.Timestamp, datetime.datetime)):
+        ts = pd.Timestamp(value)
+        return ts.tz_convert(None) if ts.tz is not None else ts
+    return value
+
+def read_parquet_range(path, columns, x, lo, hi, max_rows=None):
+    """
+    Liest nur Zeilen mit lo <= x <= hi (Zahlen bzw. naive UTC-Zeitstempel).
+    Anhand der Min/Max-Statistik im Footer werden unpassende Row-Groups
+    übersprungen; überschreiten die übrigen max_rows Zeilen, wird nichts
+    gelesen (None).
+    """
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc
+    pf = pa.parquet.ParquetFile(path, memory_map=True)
+    name = _parquet_columns(pa, path, [x])[0]
+    col = pf.schema_arrow.get_field_index(name)
+    rows = 0
+    for i in range(pf.metadata.num_row_groups):
+        group = pf.metadata.row_group(i)
+        stats = group.column(col).statistics
+        if (stats is not None and stats.has_min_max
+                and (_stat_value(stats.max) < lo or _stat_value(stats.min) > hi)):
+            continue
+        rows += group.num_rows
+    if max_rows is not None and rows > max_rows:
+        return None
+    field_type = pf.schema_arrow.field(name).type
+    if pa.types.is_timestamp(field_type):
+        # auf die Einheit der Spalte runden; naive Grenzen als UTC lesen –
+        # passt auch zu Spalten mit Zeitzone
+        lo = pd.Timestamp(lo).floor(field_type.unit).tz_localize("UTC")
+        hi = pd.Timestamp(hi).ceil(field_type.unit).tz_localize("UTC")
+    elif pa.types.is_integer(field_type):
+        lo, hi = math.ceil(lo), math.floor(hi)
+    field = pc.field(name)
+    expr = (field >= pa.scalar(lo, type=field_type)) & (field <= pa.scalar(hi, type=field_type))
+    return load_parquet(path, columns, filters=expr)
+
+def read_parquet_rows(path, columns, start, stop, max_rows=None):
+    """
+    Liest die Zeilen [start, stop) – dekodiert werden nur die Row-Groups,
+    die den Bereich abdecken (None, wenn das mehr als max_rows Zeilen wären).
+    Der DataFrame-Index enthält die Zeilennummern der Datei.
+    """
+    pa = _import_pyarrow()
+    pf = pa.parquet.ParquetFile(path, memory_map=True)
+    sizes = [pf.metadata.row_group(i).num_rows for i in range(pf.metadata.num_row_groups)]
+    bounds = np.concatenate(([0], np.cumsum(sizes)))
+    start, stop = max(0, int(start)), min(int(bounds[-1]), int(stop))
+    first = int(np.searchsorted(bounds, start, side="right")) - 1
+    last = int(np.searchsorted(bounds, stop, side="left"))
+    groups = list(range(max(first, 0), max(last, first + 1)))
+    if stop <= start or (max_rows is not None and bounds[groups[-1] + 1] - bounds[groups[0]] > max_rows):
+        return None if stop > start else load_parquet(path, columns).iloc[:0]
+    table = pf.read_row_groups(groups, columns=_parquet_columns(pa, path, columns))
+    base = int(bounds[groups[0]])
+    df = _parquet_frame(table, pd.RangeIndex(base, base + table.num_rows))
+    return df.iloc[start - base:stop - base]
+
+def load_table(path):
+    """Lädt CSV, Parquet oder Arrow/Feather – je nach Dateiendung."""
+    if is_parquet(path):
+        return load_parquet(path)
+    if is_arrow(path):
+        return load_arrow(path)
+    return load_csv(path)
+
+def _schema_columns(pa, schema):
+    """
+    Spaltentypen (numeric/categorical) aus einem Arrow-Schema. Gespeicherte
+    pandas-Indexspalten (laut pandas-Metadaten, z. B. "__index_level_0__")
+    werden beim Laden zum Index und zählen daher nicht mit.
+    """
+    meta = schema.pandas_metadata or {}
+    index_cols = {c for c in meta.get("index_columns", []) if isinstance(c, str)}
+    numeric, categorical = [], []
+    for field in schema:
+        if field.name in index_cols:
+            continue
+        name = str(field.name).strip()
+        t = field.type
+        if pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_decimal(t):
+            numeric.append(name)
+        else:
+            categorical.append(name)
+    return {"numeric": numeric, "categorical": categorical}
+
+def open_table(path, lazy_csv_bytes=LAZY_CSV_BYTES):
+    """
+    Öffnet eine einzelne Datei. Rückgabe: (df, colinfo, n_rows, row_index)
+    - Parquet: nur Footer/Schema wird gelesen; df ist ein leerer Frame mit
+      allen Spalten, die Daten lädt erst der Plot (load_parquet mit columns)
+    - Arrow/Feather: memory-mapped geladen, Spaltentypen aus dem Schema
+    - CSV: vollständig geladen, colinfo None (dann gilt infer_columns);
+      ab lazy_csv_bytes nur Zeilenindex + Kopf (df leer, row_index gesetzt)
+    row_index ist nur bei großen CSV-Dateien nicht None.
+    """
+    if is_parquet(path):
+        pa = _import_pyarrow()
+        try:
+            pf = pa.parquet.ParquetFile(path, memory_map=True)
+        except FileNotFoundError:
+            raise RuntimeError("Datei wurde nicht gefunden. Bitte Pfad prüfen.")
+        except Exception as ex:
+            raise RuntimeError(f"Parquet-Datei konnte nicht geladen werden: {ex}")
+        schema = pf.schema_arrow
+        df = schema.empty_table().to_pandas()
+        df.columns = [str(c).strip() for c in df.columns]
+        colinfo = _schema_columns(pa, schema)
+        return df, colinfo, pf.metadata.num_rows, None
+    if is_arrow(path):
+        # Schema der geladenen Tabelle (gilt für IPC-File, -Stream und Feather v1)
+        df, schema = _load_arrow_table(path)
+        return df, _schema_columns(_import_pyarrow(), schema), len(df), None
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        raise RuntimeError("Datei wurde nicht gefunden. Bitte Pfad prüfen.")
+    if size < lazy_csv_bytes:
+        df = load_csv(path)
+        return df, None, len(df), None
+    # große CSV: nur Zeilenindex + Kopf (Spaltentypen); Daten liest der Plot
+    try:
+        index = load_row_index(path)
+        head = read_rows(path, index, 0, HEAD_ROWS)
+    except Exception as ex:
+        raise RuntimeError(f"CSV konnte nicht geladen werden: {ex}")
+    return head.iloc[:0], infer_columns(head), index["n_rows"], index
+
 def infer_columns(df):
     """
     Ermittelt einfache Spaltentypen:
@@ -0,0 +1,77 @@
+# exporter.py
+# ---------------------------------------------------------
+# Export des aktuellen Plots (PNG/SVG/PDF) im Hintergrund.
+# Ablauf: Snapshot der Figure im UI-Thread (pickle), Rendern
+# und Schreiben in einem Worker-Thread auf der Kopie.
+# ---------------------------------------------------------
+
+import os
+import pickle
+import time
+
+from matplotlib.collections import Collection
+from matplotlib.lines import Line2D
+
+EXPORT_FORMATS = ("png", "svg", "pdf")
+VECTOR_FORMATS = ("svg", "pdf")
+
+# Ab so vielen Punkten/Vertices wird ein Artist in Vektorformaten gerastert
+DENSE_ARTIST_POINTS = 5000
+
+
+def snapshot_figure(fig):
+    """
+    Erstellt eine unabhängige Kopie der Figure (als Bytes).
+    Muss im UI-Thread aufgerufen werden; der Canvas wird nicht mitkopiert.
+    """
+    return pickle.dumps(fig)
+
+
+def _artist_points(artist):
+    """Anzahl Punkte/Vertices eines Line2D bzw. einer Collection."""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata())
+    if isinstance(artist, Collection):
+        return sum(len(p.vertices) for p in artist.get_paths())
+    return 0
+
+
+def rasterize_dense(fig, threshold=DENSE_ARTIST_POINTS):
+    """
+    Markiert dichte Artists (viele Punkte) als gerastert.
+    In SVG/PDF werden sie dann als eingebettetes Bild geschrieben –
+    Achsen, Beschriftungen und Legende bleiben Vektoren.
+    Rückgabe: Anzahl gerasterter Artists.
+    """
+    count = 0
+    for ax in fig.axes:
+        for artist in list(ax.lines) + list(ax.collections):
+            if _artist_points(artist) >= threshold:
+                artist.set_rasterized(True)
+                count += 1
+    return count
+
+
+def export_figure(snapshot, base_path, formats=EXPORT_FORMATS, dpi=150):
+    """
+    Schreibt den Snapshot in alle gewünschten Formate (<base_path>.<fmt>).
+    - ein einmaliges tight_layout() statt bbox_inches="tight" (spart den
+      zusätzlichen Render-Durchlauf je Datei)
+    - dichte Artists werden für Vektorformate gerastert
+    Läuft ohne Tk und darf daher in einem Worker-Thread aufgerufen werden.
+    Rückgabe: Liste von (pfad, sekunden, bytes)
+    """
+    fig = pickle.loads(snapshot)
+    fig.tight_layout()
+    rasterized = False
+
+    results = []
+    for fmt in formats:
+        if fmt in VECTOR_FORMATS and not rasterized:
+            rasterize_dense(fig)
+            rasterized = True
+        path = f"{base_path}.{fmt}"
+        t0 = time.perf_counter()
+        fig.savefig(path, format=fmt, dpi=dpi)
+        results.append((path, time.perf_counter() - t0, os.path.getsize(path)))
+    return results
@@ -0,0 +1,59 @@
+# jobs.py
+# ---------------------------------------------------------
+# Abbrechbare Hintergrund-Jobs (ein Thread je Job).
+# Der Worker liefert Zwischenergebnisse über eine Queue, die
+# der UI-Thread per root.after() abholt – Tk wird nur im
+# UI-Thread angefasst.
+# ---------------------------------------------------------
+
+import queue
+import threading
+
+
+class JobCancelled(Exception):
+    """Wird im Worker ausgelöst, sobald der Job abgebrochen wurde."""
+
+
+class Job:
+    """
+    Führt fn(job, *args) in einem eigenen Daemon-Thread aus.
+    - job.post(stage, payload): Zwischenergebnis melden (prüft zugleich auf Abbruch)
+    - job.check(): Abbruchpunkt zwischen teuren Schritten
+    - job.cancel(): Abbruch anfordern; laufende pandas-Aufrufe enden noch,
+      danach verwirft der Worker alles Weitere
+    Zum Schluss steht ("done", None) bzw. ("error", exception) in job.results.
+    """
+
+    def __init__(self, fn, *args):
+        self._fn = fn
+        self._args = args
+        self._cancel = threading.Event()
+        self.results = queue.Queue()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def check(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def post(self, stage, payload=None):
+        self.check()
+        self.results.put((stage, payload))
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def _run(self):
+        try:
+            self._fn(self, *self._args)
+            self.post("done")
+        except JobCancelled:
+            pass
+        except Exception as ex:
+            self.results.put(("error", ex))
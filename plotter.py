@@ -7,6 +7,15 @@
 import numpy as np
 import pandas as pd
 
+# Polar: ab so vielen Werten wird automatisch in Sektoren gebündelt
+POLAR_MAX_POINTS = 360
+POLAR_DEFAULT_SECTORS = 36
+POLAR_MARKER_MAX = 60   # Marker nur bis zu so vielen Punkten
+POLAR_LABEL_MAX = 36    # Sektor-Labels nur bis zu so vielen Sektoren
+POLAR_AGGS = ("sum", "mean", "max")
+# Line: Marker nur bis zu so vielen Punkten je Linie
+LINE_MARKER_MAX = 500
+
 # -----------------------------
 # Hilfsfunktionen (intern)
 # -----------------------------
@@ -19,23 +28,54 @@ def _as_xy(df, x_col):
     Rückgabe: (x_positions, x_labels oder None)
     """
     x = df[x_col]
-    if np.issubdtype(x.dtype, np.number):
+    if pd.api.types.is_numeric_dtype(x) and not pd.api.types.is_bool_dtype(x):
         # numerisch: direkt verwenden
         return x.values, None
+    if pd.api.types.is_datetime64_any_dtype(x):
+        # Datum (bereits beim Laden geparst): Matplotlib skaliert die Achse selbst
+        return x.values, None
     # alles andere behandeln wir als Kategorie/Text
-    positions = np.arange(len(x))
+    # (Ausschnitte/Vorschauen/Übersichten behalten ihre Zeilennummern)
+    if pd.api.types.is_integer_dtype(x.index):
+        positions = np.asarray(x.index)
+    else:
+        positions = np.arange(len(x))
     labels = x.astype(str).values
     return positions, labels
 
-def _apply_xtick_labels(ax, labels):
+def _overlay_positions(df, x_col):
+    """
+    X-Positionen für Overlays (mehrere Gruppen in einem Frame).
+    - Zahlen/Datum: (None, None) – Werte werden direkt verwendet
+    - Kategorie/Strings: eine gemeinsame Zuordnung Kategorie -> Position
+      (Reihenfolge des ersten Auftretens), damit gleiche Kategorien aller
+      Gruppen übereinander liegen
+    Rückgabe: (Position je Zeile, Kategorien) bzw. (None, None)
+    """
+    x = df[x_col]
+    if pd.api.types.is_numeric_dtype(x) and not pd.api.types.is_bool_dtype(x):
+        return None, None
+    if pd.api.types.is_datetime64_any_dtype(x):
+        return None, None
+    text = x.astype(str)
+    cats = pd.Index(pd.unique(text))
+    return cats.get_indexer(text), cats.tolist()
+
+def _apply_xtick_labels(ax, positions, labels):
     """Setzt X-Tick-Labels (für kategoriale X)."""
-    ax.set_xticks(np.arange(len(labels)))
+    ax.set_xticks(positions)
     ax.set_xticklabels(labels, rotation=45, ha="right")
 
 def _ensure_numeric(df, ys):
-    """Erzwingt numerische Typen für Y-Spalten (nicht konvertierbares -> NaN)."""
-    out = df.copy()
-    for c in ys:
+    """
+    Erzwingt numerische Typen für Y-Spalten (nicht konvertierbares -> NaN).
+    Bereits numerische Spalten werden nicht kopiert (z. B. Arrow-Puffer bleiben Sichten).
+    """
+    todo = [c for c in ys if not pd.api.types.is_numeric_dtype(df[c])]
+    if not todo:
+        return df
+    out = df.copy(deep=False)
+    for c in todo:
         out[c] = pd.to_numeric(out[c], errors="coerce")
     return out
 
@@ -43,16 +83,35 @@ def _ensure_numeric(df, ys):
 # Öffentliche Plot-Funktionen
 # -----------------------------
 
-def plot_line(ax, df, x, ys):
-    """Line-Plot: X Kategorie/Datum/Zahl; Y >= 1 numerisch."""
+def plot_line(ax, df, x, ys, group_col=None, band=None):
+    """
+    Line-Plot: X Kategorie/Datum/Zahl; Y >= 1 numerisch.
+    group_col (optional): je Gruppe (z. B. Quelldatei) eine eigene Linie (Overlay).
+    band (optional): {spalte: (untere, obere)} – Min/Max-Band je Linie (Zeit-Buckets).
+    """
     if not ys:
         raise ValueError("Mindestens eine Y-Spalte auswählen (Line).")
     df = _ensure_numeric(df, ys)
-    x_vals, x_labels = _as_xy(df, x)
-    for col in ys:
-        ax.plot(x_vals, df[col].values, marker="o", label=col)
+    if group_col is not None:
+        x_vals, x_labels = _overlay_positions(df, x)
+        for name, idx in df.groupby(group_col, sort=False).indices.items():
+            part_x = x_vals[idx] if x_labels is not None else df[x].values[idx]
+            marker = "o" if len(idx) <= LINE_MARKER_MAX else None
+            for col in ys:
+                ax.plot(part_x, df[col].values[idx], marker=marker, label=f"{col} ({name})")
+        if x_labels is not None:
+            # gemeinsame Ticks: eine Position je Kategorie über alle Gruppen
+            x_vals = np.arange(len(x_labels))
+    else:
+        x_vals, x_labels = _as_xy(df, x)
+        marker = "o" if len(df) <= LINE_MARKER_MAX else None
+        for col in ys:
+            (line,) = ax.plot(x_vals, df[col].values, marker=marker, label=col)
+            if band is not None and col in band:
+                lo, hi = band[col]
+                ax.fill_between(x_vals, lo, hi, color=line.get_color(), alpha=0.2, linewidth=0)
     if x_labels is not None:
-        _apply_xtick_labels(ax, x_labels)
+        _apply_xtick_labels(ax, x_vals, x_labels)
     ax.set_xlabel(x)
     ax.set_ylabel("Wert")
     ax.set_title("Line")
@@ -68,30 +127,34 @@ def plot_stacked_area(ax, df, x, ys):
     y_arrays = [df[col].fillna(0).values for col in ys]
     ax.stackplot(x_vals, *y_arrays, labels=ys, step=None)
     if x_labels is not None:
-        _apply_xtick_labels(ax, x_labels)
+        _apply_xtick_labels(ax, x_vals, x_labels)
     ax.set_xlabel(x)
     ax.set_ylabel("Wert")
     ax.set_title("Stacked Area")
     ax.legend(loc="upper left")
     ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.6)
 
-def plot_pie(ax, df, label_col, value_col, top_n=8):
+def aggregate_pie(labels, values):
     """
-    Pie-Chart mit Cleaning/Aggregation:
-      1) value numerisch
+    Pie-Aggregation mit Cleaning (vektorisiert, ohne Zeichnen – läuft im Worker):
+      1) values numerisch
       2) <=0/NaN entfernen
-      3) groupby(label).sum()
-      4) Top-N + Rest ("Andere")
-      5) axis('equal'), startangle=90
+      3) groupby(label).sum(), absteigend sortiert
+    Rückgabe: Series (Label -> Summe)
     """
-    vals = pd.to_numeric(df[value_col], errors="coerce")
-    lab = df[label_col].astype(str)
+    vals = pd.to_numeric(values, errors="coerce")
+    lab = labels.astype(str)
     mask = vals.notna() & (vals > 0)
-    vals = vals[mask]
-    lab = lab[mask]
-    if vals.empty:
+    return vals[mask].groupby(lab[mask]).sum().sort_values(ascending=False)
+
+def plot_pie(ax, agg, top_n=8):
+    """
+    Pie-Chart aus aggregate_pie:
+      1) Top-N + Rest ("Andere")
+      2) axis('equal'), startangle=90
+    """
+    if agg.empty:
         raise ValueError("Pie: Keine positiven Werte nach Cleaning.")
-    agg = vals.groupby(lab).sum().sort_values(ascending=False)
     if len(agg) > top_n:
         top = agg.iloc[:top_n]
         rest_sum = agg.iloc[top_n:].sum()
@@ -123,13 +186,90 @@ def plot_hist(ax, series, bins="auto"):
     ax.set_title("Histogram")
     ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.6)
 
-def plot_polar(ax, series):
-    """Polar-Plot: eine numerische Serie, theta gleichmäßig 0..2π."""
-    r = pd.to_numeric(series, errors="coerce").dropna().values
+def _aggregate_binned(s, g, sectors, agg):
+    """
+    Bündelt s nach Zahl-/Datumswerten g in sectors gleich breite Intervalle (pd.cut).
+    Leere Intervalle entfallen; Label = linke Intervallgrenze.
+    """
+    valid = g.notna()
+    s, g = s[valid], g[valid]
+    codes, edges = pd.cut(g, bins=sectors, labels=False, retbins=True)
+    out = s.groupby(codes.values, sort=True).agg(agg)
+    # pd.cut erweitert die erste Grenze leicht nach unten -> echtes Minimum anzeigen
+    edges = pd.Series(edges[:-1])
+    edges.iloc[0] = g.min()
+    if pd.api.types.is_datetime64_any_dtype(g):
+        labels = [pd.Timestamp(edges.iloc[int(i)]).strftime("%Y-%m-%d") for i in out.index]
+    else:
+        labels = [f"{edges.iloc[int(i)]:.4g}" for i in out.index]
+    return out.values.astype(float), labels
+
+def aggregate_polar(series, sectors=None, groups=None, agg="sum"):
+    """
+    Fasst eine Serie für den Polar-Plot in Winkelsektoren zusammen.
+    - groups (optional): Kategorie-/Zahl-/Datumsspalte; je Wert ein Sektor
+      (Datum wird auf Monate gruppiert). Gibt es mehr Werte als sectors
+      (auto: POLAR_MAX_POINTS), werden Zahlen/Datum per pd.cut in Intervalle
+      gebündelt, Kategorien nach Position
+    - sonst nach Position: sectors gleich große, zusammenhängende Abschnitte
+      (None = automatisch, erst ab POLAR_MAX_POINTS Werten)
+    - agg: "sum", "mean" oder "max" (vektorisiert per reduceat/groupby)
+    Rückgabe: (r-Werte als ndarray, Sektor-Labels oder None)
+    """
+    if agg not in POLAR_AGGS:
+        raise ValueError(f"Polar: unbekannte Aggregation '{agg}'.")
+    s = pd.to_numeric(series, errors="coerce")
+    mask = s.notna()
+    s = s[mask]
+
+    if groups is not None:
+        g = groups[mask]
+        is_date = pd.api.types.is_datetime64_any_dtype(g)
+        is_num = pd.api.types.is_numeric_dtype(g) and not pd.api.types.is_bool_dtype(g)
+        keys = g.dt.to_period("M") if is_date else g
+        limit = sectors if sectors is not None and sectors > 0 else POLAR_MAX_POINTS
+        if keys.nunique() <= limit:
+            out = s.groupby(keys.astype(str), sort=False).agg(agg)
+            return out.values.astype(float), out.index.tolist()
+        target = sectors if sectors is not None and sectors > 0 else POLAR_DEFAULT_SECTORS
+        if is_date or is_num:
+            return _aggregate_binned(s, g, target, agg)
+        # zu viele Kategorien: wie ohne groups nach Position bündeln
+        sectors = target
+
+    r = s.values.astype(float)
+    n = r.size
+    if sectors is None or sectors <= 0:
+        sectors = n if n <= POLAR_MAX_POINTS else POLAR_DEFAULT_SECTORS
+    if sectors >= n:
+        return r, None
+    # Sektor-Grenzen: Sektor k beginnt bei ceil(k * n / sectors)
+    starts = -((-np.arange(sectors) * n) // sectors)
+    if agg == "max":
+        return np.maximum.reduceat(r, starts), None
+    sums = np.add.reduceat(r, starts)
+    if agg == "mean":
+        return sums / np.diff(np.append(starts, n)), None
+    return sums, None
+
+def plot_polar(ax, r, labels=None, agg="sum", n_values=None):
+    """
+    Polar-Plot aus aggregate_polar: r je Sektor, theta gleichmäßig 0..2π;
+    gezeichnet wird ein geschlossenes Polygon.
+    n_values: Anzahl Werte vor dem Bündeln (für den Titel)
+    """
+    r = np.asarray(r, dtype=float)
     if r.size == 0:
         raise ValueError("Polar: keine numerischen Daten nach Cleaning.")
     n = r.size
     theta = np.linspace(0, 2 * np.pi, num=n, endpoint=False)
-    ax.plot(theta, r, marker="o")
-    ax.fill(theta, r, alpha=0.25)
-    ax.set_title("Polar")
+    # Polygon schließen (erster Punkt am Ende wiederholt)
+    theta_c = np.append(theta, theta[:1])
+    r_c = np.append(r, r[:1])
+    ax.plot(theta_c, r_c, marker="o" if n <= POLAR_MARKER_MAX else None)
+    ax.fill(theta_c, r_c, alpha=0.25)
+    if labels is not None and n <= POLAR_LABEL_MAX:
+        ax.set_xticks(theta)
+        ax.set_xticklabels(labels)
+    aggregated = labels is not None or (n_values is not None and n < n_values)
+    ax.set_title(f"Polar ({agg}, {n} Sektoren)" if aggregated else "Polar")
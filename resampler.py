@@ -0,0 +1,148 @@
+# resampler.py
+# ---------------------------------------------------------
+# Zeit-Buckets für Line/Stacked Area mit Datums-X.
+# Einmal beim Plotten wird eine Pyramide aufgebaut
+# (Minute -> Stunde -> Tag -> Monat); jede Stufe entsteht aus
+# der feineren, die Rohdaten werden also nur einmal gelesen.
+# Beim Zoomen wird nur noch die passende Stufe ausgeschnitten.
+# ---------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+# (Frequenz, Anzeige, ungefähre Breite in ns) – von fein nach grob
+RESAMPLE_LEVELS = [
+    ("1min", "1 Minute", 60 * 10**9),
+    ("1h", "1 Stunde", 3600 * 10**9),
+    ("1D", "1 Tag", 86400 * 10**9),
+    ("MS", "1 Monat", 30 * 86400 * 10**9),
+]
+RESAMPLE_AGGS = ("mean", "sum", "min-max")
+
+# Ab so vielen Zeilen lohnt sich die Pyramide
+RESAMPLE_MIN_ROWS = 5000
+# Rohdaten zeigen, solange höchstens so viele Punkte je Pixel sichtbar sind
+RAW_POINTS_PER_PX = 2
+
+
+def _bucket_keys(t, freq):
+    """Bucket-Anfang je Zeitstempel (Monat über Perioden, sonst floor)."""
+    if freq == "MS":
+        return t.dt.to_period("M").dt.to_timestamp()
+    return t.dt.floor(freq)
+
+
+def _reduce(parts, keys):
+    """Fasst sum/count/min/max/rows einer Stufe zur nächstgröberen zusammen."""
+    return {
+        "sum": parts["sum"].groupby(keys).sum(),
+        "count": parts["count"].groupby(keys).sum(),
+        "min": parts["min"].groupby(keys).min(),
+        "max": parts["max"].groupby(keys).max(),
+        "rows": parts["rows"].groupby(keys).sum(),
+    }
+
+
+def build_pyramid(df, x, ys):
+    """
+    Baut die Bucket-Pyramide für Datumsspalte x und Y-Spalten ys
+    (Zeitzonen-Spalten als naive UTC-Zeitstempel).
+    Stufen, die feiner als der typische Abstand der Rohdaten sind oder
+    weniger als zwei Buckets ergeben, werden ausgelassen.
+    Rückgabe: dict mit "levels" (fein -> grob) oder None, wenn keine Stufe passt.
+    """
+    t = df[x]
+    if not pd.api.types.is_datetime64_any_dtype(t):
+        return None
+    if t.dt.tz is not None:
+        # naive UTC – so rechnet auch der Zoom (num2date(...).tz_localize(None))
+        t = t.dt.tz_convert(None)
+    valid = t.notna()
+    t = t[valid]
+    if len(t) < 2:
+        return None
+    data = df.loc[valid, ys].apply(pd.to_numeric, errors="coerce")
+
+    ns = t.values.astype("datetime64[ns]").astype("int64")
+    head = np.sort(ns[:10000])
+    step = float(np.median(np.diff(head))) if head.size > 1 else 0.0
+
+    levels = []
+    parts = None
+    for freq, label, width in RESAMPLE_LEVELS:
+        if width <= step:
+            continue
+        if parts is None:
+            # einziger Durchlauf über die Rohdaten
+            keys = _bucket_keys(t, freq)
+            g = data.groupby(keys.values)
+            parts = {
+                "sum": g.sum(),
+                "count": g.count(),
+                "min": g.min(),
+                "max": g.max(),
+                "rows": g.size(),
+            }
+        else:
+            idx = pd.Series(parts["rows"].index)
+            parts = _reduce(parts, _bucket_keys(idx, freq).values)
+        if len(parts["rows"]) < 2:
+            break
+        levels.append({"freq": freq, "label": label, "width": width, **parts})
+
+    if not levels:
+        return None
+    # sortierte X-Werte erlauben beim tiefen Zoom searchsorted statt Maske
+    return {"x": x, "ys": list(ys), "levels": levels, "sorted": bool(t.is_monotonic_increasing)}
+
+
+def choose_level(pyramid, lo, hi, width_px):
+    """
+    Wählt die Stufe für den sichtbaren Bereich [lo, hi] (Timestamps):
+    - None (= Rohdaten), wenn dort höchstens RAW_POINTS_PER_PX Punkte je Pixel liegen
+    - sonst die feinste Stufe mit höchstens einem Bucket je Pixel
+    """
+    width_px = max(int(width_px), 100)
+    finest = pyramid["levels"][0]
+    rows = finest["rows"]
+    visible = rows[(rows.index >= lo.floor("min")) & (rows.index <= hi)].sum()
+    if visible <= width_px * RAW_POINTS_PER_PX:
+        return None
+    target = (hi - lo).value / width_px
+    for level in pyramid["levels"]:
+        if level["width"] >= target:
+            return level
+    return pyramid["levels"][-1]
+
+
+def level_frame(pyramid, level, agg="mean", lo=None, hi=None):
+    """
+    Schneidet eine Stufe auf [lo, hi] zu (mit je einem Bucket Rand) und
+    liefert (df, band): df hat dieselben Spalten wie die Rohdaten (x + ys),
+    band ist bei "min-max" ein dict {spalte: (min, max)}, sonst None.
+    """
+    if agg not in RESAMPLE_AGGS:
+        raise ValueError(f"Unbekannte Aggregation '{agg}'.")
+    index = level["rows"].index
+    start, stop = 0, len(index)
+    if lo is not None:
+        start = max(0, index.searchsorted(lo) - 1)
+    if hi is not None:
+        stop = min(len(index), index.searchsorted(hi, side="right") + 1)
+
+    ys = pyramid["ys"]
+    sums = level["sum"].iloc[start:stop]
+    if agg == "sum":
+        values = sums
+    else:
+        values = sums / level["count"].iloc[start:stop].replace(0, np.nan)
+
+    out = values.reset_index(drop=True)
+    out.insert(0, pyramid["x"], index[start:stop])
+    band = None
+    if agg == "min-max":
+        band = {
+            c: (level["min"][c].iloc[start:stop].values, level["max"][c].iloc[start:stop].values)
+            for c in ys
+        }
+    return out, band
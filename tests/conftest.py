@@ -0,0 +1,5 @@
+# Projektwurzel importierbar machen (die Module liegen flach im Repo)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,311 @@
+# Tests für data_loader (Locale-Erkennung, Zeilenindex)
+
+import os
+
+import pandas as pd
+import pytest
+
+from data_loader import (
+    _scan_line_offsets,
+    build_row_index,
+    combine_frames,
+    index_sorted_column,
+    load_csv,
+    load_parquet,
+    load_row_index,
+    open_table,
+    read_overview,
+    read_parquet_overview,
+    read_parquet_range,
+    read_parquet_rows,
+    read_rows,
+    source_labels,
+    x_range_to_rows,
+)
+
+GOOD = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "goodCSVs")
+
+
+def _write(tmp_path, text, name="t.csv", newline="\n"):
+    path = tmp_path / name
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text.replace("\n", newline))
+    return str(path)
+
+
+# -----------------------------
+# Locale-Erkennung
+# -----------------------------
+
+def test_german_decimal_comma_and_dates(tmp_path):
+    path = _write(tmp_path, "Datum;Wert;Umsatz\n01.02.2023;14,1;1.234,5\n02.02.2023;-1,2;999,9\n")
+    df = load_csv(path)
+    assert pd.api.types.is_datetime64_any_dtype(df["Datum"])
+    assert df["Wert"].tolist() == [14.1, -1.2]
+    assert df["Umsatz"].tolist() == [1234.5, 999.9]
+
+
+def test_ambiguous_dot_is_german_thousands_with_semicolon(tmp_path):
+    path = _write(tmp_path, "Datum;Menge\n01.02.2020;1.234\n")
+    assert load_csv(path)["Menge"].tolist() == [1234]
+
+
+def test_thousands_outside_sample_head(tmp_path):
+    rows = "".join(f"{i};1,5\n" for i in range(30))
+    path = _write(tmp_path, "A;B\n" + rows + "30;1.234,5\n")
+    df = load_csv(path)
+    assert pd.api.types.is_numeric_dtype(df["B"])
+    assert df["B"].iloc[-1] == 1234.5
+
+
+def test_german_bom_file(tmp_path):
+    path = _write(tmp_path, "\ufeffDatum;Wert\n01.02.2023;1,5\n")
+    df = load_csv(path)
+    assert list(df.columns) == ["Datum", "Wert"]
+    assert pd.api.types.is_datetime64_any_dtype(df["Datum"])
+    assert df["Wert"].tolist() == [1.5]
+
+
+def test_german_decimal_dot_not_taken_as_thousands(tmp_path):
+    path = _write(tmp_path, "A;B\n1;2,5\n2;1.5\n3;3,25\n")
+    assert load_csv(path)["B"].tolist() == [2.5, 1.5, 3.25]
+
+
+def test_iso_timestamp_with_t(tmp_path):
+    path = _write(tmp_path, "Zeit,Wert\n2023-01-01T10:00:00,1\n2023-01-01T11:30:00,2\n")
+    df = load_csv(path)
+    assert pd.api.types.is_datetime64_any_dtype(df["Zeit"])
+    assert df["Zeit"].iloc[1] == pd.Timestamp("2023-01-01 11:30:00")
+
+
+def test_english_decimal_point(tmp_path):
+    path = _write(tmp_path, "A,B\n1,1.5\n2,2.25\n")
+    assert load_csv(path)["B"].tolist() == [1.5, 2.25]
+
+
+def test_quoted_decimal_comma_column_in_comma_file():
+    df = load_csv(os.path.join(GOOD, "arbeitslosenquote_deutschland_originalwert_clean.csv"))
+    assert pd.api.types.is_numeric_dtype(df["Original_Value_Col"])
+    assert df["Original_Value_Col"].iloc[0] == pytest.approx(14.1)
+
+
+# -----------------------------
+# Zeilenindex
+# -----------------------------
+
+def _rows(n=50):
+    return [f"{i},x{i}" for i in range(n)]
+
+CASES = {
+    "lf": "a,b\n" + "".join(r + "\n" for r in _rows()),
+    "crlf": "a,b\r\n" + "".join(r + "\r\n" for r in _rows()),
+    "no_final_newline": "a,b\n" + "\n".join(_rows()),
+    "blank_lines": "a,b\n" + "".join(
+        r + "\n" + ("\n" if i == 10 else "") + ("\r\n" if i == 30 else "")
+        for i, r in enumerate(_rows())
+    ),
+    "quoted_newlines": "a,b\n" + "".join(
+        f'{i},"x\n{i}"\n' if i % 7 == 0 else f"{i},x{i}\n" for i in range(50)
+    ),
+    "quoted_crlf": "a,b\r\n" + "".join(
+        f'{i},"x\r\n{i}"\r\n' if i % 7 == 0 else f"{i},x{i}\r\n" for i in range(50)
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_scan_line_offsets_counts_records(tmp_path, name):
+    path = _write(tmp_path, CASES[name])
+    header_end, offsets, n_rows = _scan_line_offsets(path, 4)
+    assert n_rows == len(load_csv(path)) == 50
+    assert len(offsets) == 13
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[:header_end].rstrip(b"\r\n") == b"a,b"
+    for row, off in zip(range(0, 50, 4), offsets):
+        assert data[off:].startswith(f"{row},".encode())
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_scan_line_offsets_chunk_boundaries(tmp_path, name):
+    path = _write(tmp_path, CASES[name])
+    assert _scan_line_offsets(path, 4, chunk_size=7) == _scan_line_offsets(path, 4)
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+@pytest.mark.parametrize("start,stop", [(0, 50), (15, 40), (47, 50), (3, 4), (49, 60)])
+def test_read_rows_matches_full_load(tmp_path, name, start, stop):
+    path = _write(tmp_path, CASES[name])
+    df = load_csv(path)
+    index = build_row_index(path, df, block_rows=4)
+    part = read_rows(path, index, start, stop)
+    pd.testing.assert_frame_equal(part, df.iloc[start:stop])
+
+
+def test_x_range_to_rows_uses_block_bounds(tmp_path):
+    path = _write(tmp_path, CASES["lf"])
+    index = build_row_index(path, load_csv(path), block_rows=4)
+    assert x_range_to_rows(index, "a", 10, 20) == (8, 24)
+    assert x_range_to_rows(index, "a", -5, 100) == (0, 50)
+    assert x_range_to_rows(index, "b", 0, 1) is None  # Text-Spalte nicht im Index
+
+
+def test_index_rejected_when_row_count_differs(tmp_path):
+    path = _write(tmp_path, CASES["lf"])
+    df = load_csv(path).iloc[:49]
+    assert build_row_index(path, df, block_rows=4) is None
+    assert load_row_index(path, df, block_rows=4) is None
+    assert not os.path.exists(path + ".idx.json")
+
+
+def test_sorted_column_bounds_without_loaded_frame(tmp_path):
+    path = _write(tmp_path, CASES["quoted_newlines"])
+    index = load_row_index(path, block_rows=4)
+    info = index_sorted_column(path, index, "a")
+    assert info["min"][:3] == [0.0, 4.0, 8.0]
+    assert info["max"][:3] == [3.0, 7.0, 11.0]
+    assert index_sorted_column(path, index, "b") is None
+    cached = load_row_index(path, block_rows=4)
+    assert "a" in cached["sorted_columns"] and cached["unsorted_columns"] == ["b"]
+    assert x_range_to_rows(cached, "a", 10, 20) == (8, 24)
+
+
+def test_read_overview_keeps_file_row_numbers(tmp_path):
+    path = _write(tmp_path, CASES["crlf"])
+    index = load_row_index(path, block_rows=4)
+    df = read_overview(path, index, columns=["a"], max_rows=6, max_reads=3)
+    assert list(df.columns) == ["a"]
+    assert df["a"].tolist() == df.index.tolist()
+    assert df.index.tolist() == [0, 1, 24, 25, 48, 49]
+
+
+def test_large_csv_opened_through_index(tmp_path):
+    path = _write(tmp_path, CASES["lf"])
+    df, colinfo, n_rows, index = open_table(path, lazy_csv_bytes=0)
+    assert len(df) == 0 and list(df.columns) == ["a", "b"]
+    assert n_rows == 50 and index["n_rows"] == 50
+    assert colinfo == {"numeric": ["a"], "categorical": ["b"]}
+    assert os.path.exists(path + ".idx.json")
+    assert open_table(path)[3] is None  # kleine Datei: vollständig geladen
+
+
+def test_index_rebuilt_after_file_change(tmp_path):
+    path = _write(tmp_path, CASES["lf"])
+    first = load_row_index(path, load_csv(path), block_rows=4)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("50,x50\n")
+    os.utime(path, (first["mtime"] + 10, first["mtime"] + 10))
+    second = load_row_index(path, load_csv(path), block_rows=4)
+    assert second["n_rows"] == 51
+
+
+# -----------------------------
+# Mehrere Dateien
+# -----------------------------
+
+def test_source_labels_disambiguate_same_file_names(tmp_path):
+    paths = [str(tmp_path / "2023" / "daten.csv"), str(tmp_path / "2024" / "daten.csv"),
+             str(tmp_path / "andere.csv")]
+    assert source_labels(paths) == ["2023/daten.csv", "2024/daten.csv", "andere.csv"]
+
+
+def test_combine_frames_keeps_existing_source_column():
+    a = pd.DataFrame({"x": [1, 2], "Quelle": ["Sensor A", "Sensor A"]})
+    b = pd.DataFrame({"x": [3], "Quelle": ["Sensor B"]})
+    df, dropped, source_col = combine_frames([("/d/a.csv", a, 0.0), ("/d/b.csv", b, 0.0)])
+    assert source_col == "Quelle_1"
+    assert dropped == []
+    assert df["Quelle"].tolist() == ["Sensor A", "Sensor A", "Sensor B"]
+    assert df[source_col].tolist() == ["a.csv", "a.csv", "b.csv"]
+
+
+# -----------------------------
+# Parquet / Arrow (optional: pyarrow)
+# -----------------------------
+
+def _frame():
+    return pd.DataFrame({"x": [1, 2, 3], " y ": [0.5, 1.5, 2.5], "name": ["a", "b", "c"]})
+
+
+def test_parquet_opens_schema_only(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "t.parquet")
+    pq.write_table(pytest.importorskip("pyarrow").Table.from_pandas(_frame()), path)
+    df, colinfo, n_rows, _index = open_table(path)
+    assert len(df) == 0 and n_rows == 3
+    assert list(df.columns) == ["x", "y", "name"]
+    assert colinfo == {"numeric": ["x", "y"], "categorical": ["name"]}
+    part = load_parquet(path, columns=["x", "y"])
+    assert list(part.columns) == ["x", "y"]
+    assert part["y"].tolist() == [0.5, 1.5, 2.5]
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")  # Feather v1 (neuere pyarrow)
+@pytest.mark.parametrize("fmt", ["file", "stream", "feather_v1"])
+def test_arrow_formats_open_with_schema(tmp_path, fmt):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.feather
+    table = pa.Table.from_pandas(_frame(), preserve_index=False)
+    path = str(tmp_path / "t.arrow")
+    if fmt == "feather_v1":
+        pyarrow.feather.write_feather(table, path, version=1)
+    else:
+        writer = pa.ipc.new_file if fmt == "file" else pa.ipc.new_stream
+        with pa.OSFile(path, "wb") as sink, writer(sink, table.schema) as w:
+            w.write_table(table)
+    df, colinfo, n_rows, _index = open_table(path)
+    assert n_rows == 3
+    assert list(df.columns) == ["x", "y", "name"]
+    assert colinfo == {"numeric": ["x", "y"], "categorical": ["name"]}
+    assert df["name"].tolist() == ["a", "b", "c"]
+
+
+def test_parquet_stored_index_not_counted(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": ["u", "v"]}, index=[10, 20])
+    path = str(tmp_path / "t.parquet")
+    pq.write_table(pa.Table.from_pandas(df), path)
+    _df, colinfo, _n, _index = open_table(path)
+    assert colinfo == {"numeric": ["a"], "categorical": ["b"]}
+
+
+def _parquet_groups(tmp_path, tz=None):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "t": pd.date_range("2020-01-01", periods=1000, freq="min", tz=tz),
+        "x": range(1000),
+        "y": [float(i) for i in range(1000)],
+    })
+    path = str(tmp_path / "t.parquet")
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, row_group_size=100)
+    return path
+
+
+def test_read_parquet_range_skips_row_groups(tmp_path):
+    path = _parquet_groups(tmp_path)
+    part = read_parquet_range(path, ["x", "y"], "x", 250.5, 260)
+    assert part["x"].tolist() == list(range(251, 261))
+    # 251..260 liegen in einer Row-Group (100 Zeilen)
+    assert read_parquet_range(path, ["x"], "x", 250, 260, max_rows=100) is not None
+    assert read_parquet_range(path, ["x"], "x", 150, 260, max_rows=100) is None
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+def test_read_parquet_range_datetime_as_naive_utc(tmp_path, tz):
+    path = _parquet_groups(tmp_path, tz=tz)
+    lo = pd.Timestamp("2020-01-01 05:00") - (pd.Timedelta(hours=1) if tz else pd.Timedelta(0))
+    part = read_parquet_range(path, ["t", "y"], "t", lo, lo + pd.Timedelta(minutes=9))
+    assert part["y"].tolist() == [float(i) for i in range(300, 310)]
+
+
+def test_read_parquet_rows_and_overview(tmp_path):
+    path = _parquet_groups(tmp_path)
+    part = read_parquet_rows(path, ["y"], 195, 205)
+    assert part.index.tolist() == list(range(195, 205))
+    assert part["y"].tolist() == [float(i) for i in range(195, 205)]
+    assert read_parquet_rows(path, ["y"], 195, 205, max_rows=100) is None
+    overview = read_parquet_overview(path, ["x", "y"], max_rows=300)
+    assert overview.index.tolist() == list(range(0, 1000, 4))
+    assert overview["x"].tolist() == overview.index.tolist()
@@ -0,0 +1,44 @@
+# Tests für exporter (Snapshot, Rastern dichter Artists, Export)
+
+import os
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from exporter import DENSE_ARTIST_POINTS, export_figure, rasterize_dense, snapshot_figure
+
+
+def _figure(points):
+    fig = Figure()
+    ax = fig.add_subplot(111)
+    ax.plot(np.arange(points), np.random.rand(points), label="dicht")
+    ax.plot([0, 1, 2], [1, 0, 1], label="dünn")
+    ax.fill_between(np.arange(points), 0, 1)
+    return fig
+
+
+def test_rasterize_dense_marks_only_dense_artists():
+    fig = _figure(DENSE_ARTIST_POINTS)
+    ax = fig.axes[0]
+    assert rasterize_dense(fig) == 2
+    dense, thin = ax.lines
+    assert dense.get_rasterized() and not thin.get_rasterized()
+    assert ax.collections[0].get_rasterized()
+
+
+def test_export_figure_writes_all_formats(tmp_path):
+    fig = _figure(DENSE_ARTIST_POINTS * 2)
+    base = str(tmp_path / "plot")
+    results = export_figure(snapshot_figure(fig), base, formats=("png", "svg", "pdf"), dpi=50)
+    assert [p for p, _secs, _size in results] == [f"{base}.png", f"{base}.svg", f"{base}.pdf"]
+    for path, secs, size in results:
+        assert secs >= 0
+        assert size == os.path.getsize(path) > 0
+    with open(f"{base}.svg", encoding="utf-8") as f:
+        assert "<image" in f.read()  # dichte Linie als eingebettetes Bild
+    # das Original bleibt unverändert (Export arbeitet auf der Kopie)
+    assert not fig.axes[0].lines[0].get_rasterized()
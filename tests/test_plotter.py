@@ -0,0 +1,108 @@
+# Tests für plotter (Overlay-Positionen, Polar-Sektoren, Pie/Polar aus Aggregaten)
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+
+from plotter import (
+    POLAR_DEFAULT_SECTORS,
+    aggregate_pie,
+    aggregate_polar,
+    plot_line,
+    plot_pie,
+    plot_polar,
+)
+
+
+def _ax():
+    return Figure().add_subplot(111)
+
+
+# -----------------------------
+# Overlay (mehrere Dateien)
+# -----------------------------
+
+def test_overlay_shares_category_positions():
+    df = pd.DataFrame({
+        "Monat": ["Jan", "Feb", "Mar", "Feb", "Mar", "Apr"],
+        "Wert": [1, 2, 3, 4, 5, 6],
+        "Quelle": ["b.csv"] * 3 + ["a.csv"] * 3,
+    })
+    ax = _ax()
+    plot_line(ax, df, "Monat", ["Wert"], group_col="Quelle")
+    lines = {l.get_label(): list(l.get_xdata()) for l in ax.lines}
+    assert lines == {"Wert (b.csv)": [0, 1, 2], "Wert (a.csv)": [1, 2, 3]}
+    assert list(ax.get_xticks()) == [0, 1, 2, 3]
+    assert [t.get_text() for t in ax.get_xticklabels()] == ["Jan", "Feb", "Mar", "Apr"]
+
+
+def test_overlay_numeric_x_unchanged():
+    df = pd.DataFrame({"x": [10, 20, 15, 25], "y": [1.0, 2.0, 3.0, 4.0], "Quelle": ["a", "a", "b", "b"]})
+    ax = _ax()
+    plot_line(ax, df, "x", ["y"], group_col="Quelle")
+    assert [list(l.get_xdata()) for l in ax.lines] == [[10, 20], [15, 25]]
+
+
+# -----------------------------
+# Polar: Sektoren nach X-Spalte
+# -----------------------------
+
+def test_polar_groups_within_limit_one_sector_each():
+    r, labels = aggregate_polar(pd.Series([1.0, 2.0, 3.0, 4.0]),
+                                groups=pd.Series(["a", "b", "a", "c"]))
+    assert labels == ["a", "b", "c"]
+    assert r.tolist() == [4.0, 2.0, 4.0]
+
+
+def test_polar_numeric_groups_binned_to_sector_count():
+    s = pd.Series(np.ones(1000))
+    r, labels = aggregate_polar(s, sectors=10, groups=pd.Series(np.arange(1000.0)))
+    assert len(r) == len(labels) == 10
+    assert r.sum() == 1000
+    assert labels[0] == "0"
+
+
+def test_polar_numeric_groups_auto_limit():
+    r, _labels = aggregate_polar(pd.Series(np.ones(1000)), groups=pd.Series(np.arange(1000)))
+    assert len(r) == POLAR_DEFAULT_SECTORS
+
+
+def test_polar_categorical_groups_fall_back_to_position():
+    groups = pd.Series([f"k{i}" for i in range(1000)])
+    r, labels = aggregate_polar(pd.Series(np.ones(1000)), sectors=20, groups=groups)
+    assert labels is None
+    assert len(r) == 20 and r.sum() == 1000
+
+
+# -----------------------------
+# Pie/Polar: Zeichnen aus vorberechneten Werten
+# -----------------------------
+
+def test_aggregate_pie_cleans_and_sorts():
+    agg = aggregate_pie(pd.Series(["a", "b", "a", "c", "d"]),
+                        pd.Series(["1", "5", "2", None, "-3"]))
+    assert agg.to_dict() == {"b": 5.0, "a": 3.0}
+    assert agg.index.tolist() == ["b", "a"]
+
+
+def test_plot_pie_groups_rest():
+    agg = pd.Series([5.0, 4.0, 3.0, 2.0], index=["a", "b", "c", "d"])
+    ax = _ax()
+    plot_pie(ax, agg, top_n=2)
+    assert [t.get_text() for t in ax.texts if "%" not in t.get_text()] == ["a", "b", "Andere"]
+    with pytest.raises(ValueError):
+        plot_pie(_ax(), agg.iloc[:0])
+
+
+def test_plot_polar_title_from_counts():
+    ax = Figure().add_subplot(111, projection="polar")
+    plot_polar(ax, np.ones(10), agg="mean", n_values=1000)
+    assert ax.get_title() == "Polar (mean, 10 Sektoren)"
+    ax = Figure().add_subplot(111, projection="polar")
+    plot_polar(ax, np.ones(10), n_values=10)
+    assert ax.get_title() == "Polar"
@@ -0,0 +1,91 @@
+# Tests für resampler (Bucket-Pyramide, Stufenwahl, Ausschnitt)
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from resampler import build_pyramid, choose_level, level_frame
+
+
+def _minutes(n, tz=None):
+    return pd.DataFrame({
+        "t": pd.date_range("2020-01-01", periods=n, freq="min", tz=tz),
+        "v": np.ones(n),
+    })
+
+
+# -----------------------------
+# build_pyramid
+# -----------------------------
+
+def test_pyramid_skips_levels_finer_than_data():
+    pyramid = build_pyramid(_minutes(3 * 24 * 60), "t", ["v"])
+    # Minutendaten: 1-Minuten-Stufe entfällt, Monat ergibt < 2 Buckets
+    assert [lvl["freq"] for lvl in pyramid["levels"]] == ["1h", "1D"]
+    hours = pyramid["levels"][0]
+    assert len(hours["rows"]) == 72
+    assert hours["sum"]["v"].eq(60).all()
+    assert pyramid["sorted"]
+
+
+def test_pyramid_requires_datetime_x():
+    df = pd.DataFrame({"t": np.arange(10), "v": np.ones(10)})
+    assert build_pyramid(df, "t", ["v"]) is None
+
+
+def test_pyramid_timezone_as_naive_utc():
+    pyramid = build_pyramid(_minutes(3 * 24 * 60, tz="Europe/Berlin"), "t", ["v"])
+    index = pyramid["levels"][0]["rows"].index
+    assert index.tz is None
+    assert index[0] == pd.Timestamp("2019-12-31 23:00")
+
+
+# -----------------------------
+# choose_level / level_frame
+# -----------------------------
+
+def test_choose_level_raw_when_few_points_visible():
+    pyramid = build_pyramid(_minutes(3 * 24 * 60), "t", ["v"])
+    lo = pd.Timestamp("2020-01-02 00:00")
+    # gezählt wird in Buckets der feinsten Stufe (hier: 60 Zeilen je Stunde)
+    assert choose_level(pyramid, lo, lo + pd.Timedelta(minutes=59), 100) is None
+    # 5 Stunden-Buckets = 300 Zeilen > 100 px * RAW_POINTS_PER_PX
+    assert choose_level(pyramid, lo, lo + pd.Timedelta(hours=4), 100)["freq"] == "1h"
+
+
+def test_choose_level_finest_fitting_level():
+    pyramid = build_pyramid(_minutes(60 * 24 * 60), "t", ["v"])
+    lo, hi = pd.Timestamp("2020-01-01"), pd.Timestamp("2020-02-29 23:59")
+    assert choose_level(pyramid, lo, hi, 2000)["freq"] == "1h"   # 43 min je Pixel
+    assert choose_level(pyramid, lo, hi, 100)["freq"] == "1D"    # 14,4 h je Pixel
+    assert choose_level(pyramid, lo, hi, 10)["freq"] == "1D"     # mindestens 100 px
+
+
+@pytest.mark.parametrize("agg, expected", [("mean", 1.0), ("sum", 60.0)])
+def test_level_frame_values_and_window(agg, expected):
+    pyramid = build_pyramid(_minutes(3 * 24 * 60), "t", ["v"])
+    level = pyramid["levels"][0]
+    lo, hi = pd.Timestamp("2020-01-02 05:00"), pd.Timestamp("2020-01-02 08:00")
+    df, band = level_frame(pyramid, level, agg, lo, hi)
+    assert list(df.columns) == ["t", "v"]
+    # ein Bucket Rand auf jeder Seite
+    assert df["t"].iloc[0] == pd.Timestamp("2020-01-02 04:00")
+    assert df["t"].iloc[-1] == pd.Timestamp("2020-01-02 09:00")
+    assert df["v"].eq(expected).all()
+    assert band is None
+
+
+def test_level_frame_min_max_band():
+    df = _minutes(2 * 24 * 60)
+    df["v"] = np.arange(len(df), dtype=float)
+    pyramid = build_pyramid(df, "t", ["v"])
+    out, band = level_frame(pyramid, pyramid["levels"][0], "min-max")
+    lo, hi = band["v"]
+    assert lo[0] == 0 and hi[0] == 59
+    assert out["v"].iloc[0] == pytest.approx(29.5)
+
+
+def test_level_frame_rejects_unknown_agg():
+    pyramid = build_pyramid(_minutes(3 * 24 * 60), "t", ["v"])
+    with pytest.raises(ValueError):
+        level_frame(pyramid, pyramid["levels"][0], "median")
@@ -5,7 +5,7 @@
 
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 
 
@@ -32,7 +32,7 @@ class MainUI:
         self.paned.bind("<B1-Motion>", lambda _e: self._fix_left_width(400))
 
         # Datei-Button
-        self.btn_open = ttk.Button(left_frame, text="CSV öffnen")
+        self.btn_open = ttk.Button(left_frame, text="Datei öffnen")
         self.btn_open.pack(padx=5, pady=5, anchor="w")
 
         # Diagrammtyp
@@ -57,14 +57,47 @@ class MainUI:
         self.lst_y = tk.Listbox(y_frame, selectmode=tk.MULTIPLE, exportselection=False, height=5)
         self.lst_y.pack(fill="x", expand=True)
 
+        # Polar-Optionen (Winkelsektoren)
+        polar_frame = ttk.LabelFrame(left_frame, text="Polar: Sektoren")
+        polar_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Label(polar_frame, text="Anzahl (0 = auto):").pack(side="left", padx=(3, 0))
+        self.polar_sectors = tk.IntVar(value=0)
+        ttk.Spinbox(polar_frame, from_=0, to=360, width=5,
+                    textvariable=self.polar_sectors).pack(side="left", padx=3, pady=3)
+        ttk.Label(polar_frame, text="Aggregation:").pack(side="left", padx=(8, 0))
+        self.cmb_polar_agg = ttk.Combobox(polar_frame, state="readonly", width=6,
+                                          values=["sum", "mean", "max"])
+        self.cmb_polar_agg.set("sum")
+        self.cmb_polar_agg.pack(side="left", padx=3, pady=3)
+
+        # Zeit-Buckets (Line/Stacked Area mit Datums-X)
+        time_frame = ttk.LabelFrame(left_frame, text="Zeitreihe: Buckets")
+        time_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Label(time_frame, text="Aggregation:").pack(side="left", padx=(3, 0))
+        self.cmb_time_agg = ttk.Combobox(time_frame, state="readonly", width=8,
+                                         values=["mean", "sum", "min-max"])
+        self.cmb_time_agg.set("mean")
+        self.cmb_time_agg.pack(side="left", padx=3, pady=3)
+
         # Buttons
         btns = ttk.Frame(left_frame)
         btns.pack(fill="x", padx=5, pady=8)
         self.btn_plot = ttk.Button(btns, text="Plot erzeugen", state="disabled")
         self.btn_plot.pack(side="left")
-        self.btn_save = ttk.Button(btns, text="Als PNG speichern", state="normal")
+        self.btn_cancel = ttk.Button(btns, text="Abbrechen", state="disabled")
+        self.btn_cancel.pack(side="left", padx=(4, 0))
+        self.btn_save = ttk.Button(btns, text="Exportieren", state="normal")
         self.btn_save.pack(side="left", padx=8)
 
+        # Exportformate (mehrere = ein Batch-Export)
+        self.export_formats = {
+            "png": tk.BooleanVar(value=True),
+            "svg": tk.BooleanVar(value=False),
+            "pdf": tk.BooleanVar(value=False),
+        }
+        for fmt, var in self.export_formats.items():
+            ttk.Checkbutton(btns, text=fmt.upper(), variable=var).pack(side="left")
+
         # Details
         details_frame = ttk.LabelFrame(left_frame, text="Details / Statistik")
         details_frame.pack(fill="both", expand=True, padx=5, pady=(0, 5))
@@ -75,6 +108,10 @@ class MainUI:
         self.fig = Figure(figsize=(6, 4))
         self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        # Toolbar (Zoom/Pan) unter dem Plot – vor dem Canvas packen, damit sie sichtbar bleibt
+        self.toolbar = NavigationToolbar2Tk(self.canvas, right_frame, pack_toolbar=False)
+        self.toolbar.update()
+        self.toolbar.pack(side=tk.BOTTOM, fill="x")
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 